@@ -6,63 +6,84 @@ dans différents projets, principalement:
 - Gestion des logs (configuration, rotation, purge)
 - Gestion des versions (lecture, incrémentation)
 - Gestion des fichiers (lecture/écriture sécurisée)
+- Variantes asyncio des fonctions de fichiers (EndoriumUtils.aio)
 - Gestion des configurations (chargement/sauvegarde)
+- Métriques de performance (compteurs et percentiles de latence)
 """
 
-from EndoriumUtils.log_utils import (
-    setup_logger,
-    get_logger,
-    log_function_call,
-    log_performance,
-    purge_old_logs,
-    set_log_level,
-    get_log_file_paths,
-    log_exceptions,
-)
-from EndoriumUtils.version_utils import (
-    get_version,
-    increment_version,
-    set_version,
-)
-from EndoriumUtils.file_utils import (
-    safe_read_file,
-    safe_write_file,
-    ensure_dir_exists,
-    get_file_hash,
-    is_file_newer_than,
-)
-from EndoriumUtils.config_utils import (
-    load_config,
-    save_config,
-    get_config_value,
-    set_config_value,
-)
-from EndoriumUtils.auth_utils import (
-    get_authenticator,
-)
+import importlib
 
-__all__ = [
-    "setup_logger",
-    "get_logger",
-    "log_function_call",
-    "log_performance",
-    "purge_old_logs",
-    "set_log_level",
-    "get_log_file_paths",
-    "log_exceptions",
-    "get_version",
-    "increment_version",
-    "set_version",
-    "safe_read_file",
-    "safe_write_file",
-    "ensure_dir_exists",
-    "get_file_hash",
-    "is_file_newer_than",
-    "load_config",
-    "save_config",
-    "get_config_value",
-    "set_config_value",
-    "get_authenticator",
-]
+# Les sous-modules ne sont importés qu'au premier accès à l'un de leurs
+# attributs (PEP 562): importer le package ne crée aucun logger ni fichier.
+_LAZY_ATTRIBUTES = {
+    "setup_logger": "EndoriumUtils.log_utils",
+    "get_logger": "EndoriumUtils.log_utils",
+    "log_function_call": "EndoriumUtils.log_utils",
+    "log_performance": "EndoriumUtils.log_utils",
+    "purge_old_logs": "EndoriumUtils.log_utils",
+    "start_log_purge_scheduler": "EndoriumUtils.log_utils",
+    "stop_log_purge_scheduler": "EndoriumUtils.log_utils",
+    "set_log_level": "EndoriumUtils.log_utils",
+    "get_log_file_paths": "EndoriumUtils.log_utils",
+    "log_exceptions": "EndoriumUtils.log_utils",
+    "clear_logger_registry": "EndoriumUtils.log_utils",
+    "enable_async_logging": "EndoriumUtils.log_utils",
+    "disable_async_logging": "EndoriumUtils.log_utils",
+    "configure_log_rotation": "EndoriumUtils.log_utils",
+    "get_version": "EndoriumUtils.version_utils",
+    "increment_version": "EndoriumUtils.version_utils",
+    "set_version": "EndoriumUtils.version_utils",
+    "safe_read_file": "EndoriumUtils.file_utils",
+    "safe_write_file": "EndoriumUtils.file_utils",
+    "safe_write_stream": "EndoriumUtils.file_utils",
+    "iter_lines": "EndoriumUtils.file_utils",
+    "iter_chunks": "EndoriumUtils.file_utils",
+    "read_bytes_view": "EndoriumUtils.file_utils",
+    "ensure_dir_exists": "EndoriumUtils.file_utils",
+    "get_file_hash": "EndoriumUtils.file_utils",
+    "hash_files": "EndoriumUtils.file_utils",
+    "detect_changes": "EndoriumUtils.file_utils",
+    "is_file_newer_than": "EndoriumUtils.file_utils",
+    "file_lock": "EndoriumUtils.file_utils",
+    "load_config": "EndoriumUtils.config_utils",
+    "save_config": "EndoriumUtils.config_utils",
+    "get_config_value": "EndoriumUtils.config_utils",
+    "set_config_value": "EndoriumUtils.config_utils",
+    "compile_key_path": "EndoriumUtils.config_utils",
+    "get_config_values": "EndoriumUtils.config_utils",
+    "set_password": "EndoriumUtils.config_utils",
+    "verify_password": "EndoriumUtils.config_utils",
+    "set_password_async": "EndoriumUtils.config_utils",
+    "verify_password_async": "EndoriumUtils.config_utils",
+    "set_passwords": "EndoriumUtils.config_utils",
+    "verify_passwords": "EndoriumUtils.config_utils",
+    "calibrate_pbkdf2_iterations": "EndoriumUtils.config_utils",
+    "get_authenticator": "EndoriumUtils.auth_utils",
+    "get_metrics_registry": "EndoriumUtils.metrics_utils",
+    "get_metrics_snapshot": "EndoriumUtils.metrics_utils",
+    "reset_metrics": "EndoriumUtils.metrics_utils",
+}
+
+# Sous-modules accessibles comme attributs du package (EndoriumUtils.config_utils),
+# importés eux aussi au premier accès
+_LAZY_SUBMODULES = ("log_utils", "file_utils", "config_utils", "version_utils",
+                    "auth_utils", "metrics_utils", "aio")
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        # import_module enregistre lui-même le sous-module comme attribut du package
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Mise en cache: les accès suivants ne passent plus par __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
 
 __version__ = "1.2.5"
@@ -0,0 +1,202 @@
+"""
+Variantes asyncio des utilitaires de fichiers pour EndoriumUtils
+
+Chaque fonction exécute son équivalent synchrone de file_utils dans un pool
+de threads partagé et borné: la boucle d'événements n'est jamais bloquée par
+les entrées/sorties disque, et les garanties (écriture atomique, valeur de
+retour en cas d'erreur) sont celles de la version synchrone.
+
+    from EndoriumUtils import aio
+
+    content = await aio.safe_read_file("config.json")
+    await aio.safe_write_file("etat.json", content, fsync=True)
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from EndoriumUtils import file_utils
+from EndoriumUtils.log_utils import get_lazy_logger
+
+logger = get_lazy_logger("EndoriumUtils.aio")
+
+# Pool partagé par toutes les fonctions du module, créé au premier appel
+_executor = None
+_executor_lock = threading.Lock()
+_max_workers = None
+
+def _default_max_workers() -> int:
+    return min(32, (os.cpu_count() or 1) + 4)
+
+def get_executor() -> ThreadPoolExecutor:
+    """Renvoie le pool de threads partagé (créé au premier appel)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_max_workers or _default_max_workers(),
+                                               thread_name_prefix="EndoriumUtils-aio")
+    return _executor
+
+def set_max_workers(max_workers: Optional[int]) -> None:
+    """
+    Fixe la taille du pool partagé (le pool existant est arrêté après ses tâches en cours)
+
+    Args:
+        max_workers (int, optional): Nombre maximal de threads (None: min(32, processeurs + 4))
+    """
+    global _max_workers
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers doit être supérieur ou égal à 1")
+    _max_workers = max_workers
+    shutdown_executor(wait=False)
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Arrête le pool partagé; un nouveau pool sera créé au prochain appel"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Exécute une fonction bloquante dans le pool partagé
+
+    Le contexte (contextvars) de l'appelant est propagé, comme avec asyncio.to_thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+async def ensure_dir_exists(directory: str) -> bool:
+    """Version asynchrone de file_utils.ensure_dir_exists"""
+    return await run_in_pool(file_utils.ensure_dir_exists, directory)
+
+async def safe_read_file(file_path: str, default_content: str = "", encoding: str = "utf-8") -> str:
+    """Version asynchrone de file_utils.safe_read_file"""
+    return await run_in_pool(file_utils.safe_read_file, file_path, default_content, encoding)
+
+async def safe_write_file(file_path: str, content: Union[str, bytes], encoding: str = "utf-8",
+                          create_backup: bool = False, fsync: bool = False,
+                          lock: bool = False, lock_timeout: Optional[float] = None) -> bool:
+    """Version asynchrone de file_utils.safe_write_file (même écriture atomique)"""
+    return await run_in_pool(file_utils.safe_write_file, file_path, content, encoding,
+                             create_backup, fsync, lock, lock_timeout)
+
+async def get_file_hash(file_path: str, algorithm: str = "sha256",
+                        cache: Optional[file_utils.FileHashCache] = None) -> Optional[str]:
+    """Version asynchrone de file_utils.get_file_hash"""
+    return await run_in_pool(file_utils.get_file_hash, file_path, algorithm, cache)
+
+async def is_file_newer_than(file_path: str, reference_time: Union[float, int]) -> bool:
+    """Version asynchrone de file_utils.is_file_newer_than"""
+    return await run_in_pool(file_utils.is_file_newer_than, file_path, reference_time)
+
+async def read_bytes_view(file_path: str) -> Optional[memoryview]:
+    """Version asynchrone de file_utils.read_bytes_view"""
+    return await run_in_pool(file_utils.read_bytes_view, file_path)
+
+async def iter_lines(file_path: str, encoding: str = "utf-8", errors: Optional[str] = None,
+                     batch_size: int = 1000) -> AsyncIterator[str]:
+    """
+    Version asynchrone de file_utils.iter_lines
+
+    Les lignes sont lues par lots de batch_size dans le pool: un seul passage
+    par le pool pour plusieurs milliers de lignes.
+
+    Yields:
+        str: Lignes du fichier (avec leur fin de ligne)
+    """
+    lines = file_utils.iter_lines(file_path, encoding, errors)
+    # Un lot encore en cours dans le pool (consommateur annulé) doit se terminer
+    # avant la fermeture: le générateur ne peut pas être fermé pendant son exécution
+    lines_lock = threading.Lock()
+
+    def _next_batch() -> List[str]:
+        batch = []
+        with lines_lock:
+            for line in lines:
+                batch.append(line)
+                if len(batch) >= batch_size:
+                    break
+        return batch
+
+    def _close() -> None:
+        with lines_lock:
+            lines.close()
+
+    try:
+        while True:
+            batch = await run_in_pool(_next_batch)
+            if not batch:
+                break
+            for line in batch:
+                yield line
+    finally:
+        # Fermer le fichier depuis le pool si l'itération est interrompue
+        await run_in_pool(_close)
+
+def _batches(items: List[Any], batch_size: int) -> List[List[Any]]:
+    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+async def _run_batched(func, items: List[Any], batch_size: int) -> List[Any]:
+    """Applique func à chaque élément: une tâche du pool par lot, lots exécutés en parallèle"""
+    if batch_size < 1:
+        raise ValueError("batch_size doit être supérieur ou égal à 1")
+    results = await asyncio.gather(*(
+        run_in_pool(lambda batch=batch: [func(item) for item in batch])
+        for batch in _batches(items, batch_size)))
+    return [result for batch in results for result in batch]
+
+async def read_files(paths: Iterable[str], default_content: str = "", encoding: str = "utf-8",
+                     batch_size: int = 16) -> Dict[str, str]:
+    """
+    Lit plusieurs fichiers (petits fichiers regroupés par lots dans le pool)
+
+    Args:
+        paths (iterable): Chemins des fichiers
+        default_content (str): Contenu renvoyé pour un fichier absent ou illisible
+        encoding (str): Encodage à utiliser
+        batch_size (int): Nombre de fichiers lus par tâche du pool
+
+    Returns:
+        dict: Contenu par chemin
+    """
+    paths = list(paths)
+    contents = await _run_batched(
+        lambda path: file_utils.safe_read_file(path, default_content, encoding), paths, batch_size)
+    return dict(zip(paths, contents))
+
+async def write_files(files: Dict[str, Union[str, bytes]], encoding: str = "utf-8",
+                      create_backup: bool = False, fsync: bool = False,
+                      batch_size: int = 16) -> Dict[str, bool]:
+    """
+    Écrit plusieurs fichiers, chacun de manière atomique (voir safe_write_file)
+
+    Args:
+        files (dict): Contenu par chemin
+        encoding (str): Encodage à utiliser
+        create_backup (bool): Si True, crée une sauvegarde (.bak) de chaque fichier existant
+        fsync (bool): Si True, force l'écriture sur disque de chaque fichier
+        batch_size (int): Nombre de fichiers écrits par tâche du pool
+
+    Returns:
+        dict: Résultat (True si l'écriture a réussi) par chemin
+    """
+    items = list(files.items())
+    results = await _run_batched(
+        lambda item: file_utils.safe_write_file(item[0], item[1], encoding, create_backup, fsync),
+        items, batch_size)
+    return {path: result for (path, _), result in zip(items, results)}
+
+async def hash_files(paths: Iterable[str], algorithm: str = "sha256", workers: Optional[int] = None,
+                     cache: Optional[file_utils.FileHashCache] = None) -> Dict[str, Optional[str]]:
+    """Version asynchrone de file_utils.hash_files"""
+    return await run_in_pool(file_utils.hash_files, list(paths), algorithm, workers, cache)
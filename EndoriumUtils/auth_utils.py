@@ -9,31 +9,99 @@ Supporte :
 - Authentification SSO (Google, Microsoft, Apple) [placeholders]
 """
 
+import os
+import time
+import hmac
+import queue
 import hashlib
+import secrets
 import sqlite3
-from typing import Optional, Dict, Any
+import itertools
+import threading
+import collections
+from concurrent.futures import Executor
+from urllib.request import pathname2url
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 
 try:
     import ldap3
+    from ldap3.core.exceptions import LDAPException, LDAPCommunicationError
 except ImportError:
     ldap3 = None
+    LDAPException = LDAPCommunicationError = Exception
 
-from EndoriumUtils.log_utils import get_logger, log_function_call
+from EndoriumUtils.log_utils import get_lazy_logger, log_function_call
 
-logger = get_logger("EndoriumUtils.auth_utils")
+logger = get_lazy_logger("EndoriumUtils.auth_utils")
 
 class BaseAuthenticator:
     def authenticate(self, username: str, password: str) -> bool:
         raise NotImplementedError
 
+    def _authenticate(self, username: str, password: str) -> bool:
+        """Vérification sans décorateur de log (utilisée par authenticate_many)"""
+        return self.authenticate(username, password)
+
+    def _authenticate_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        for username, password in pairs:
+            yield username, self._authenticate(username, password)
+
+    def authenticate_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        """
+        Vérifie un grand nombre d'identifiants, résultats renvoyés au fil de l'eau
+
+        Les paires sont consommées paresseusement et chaque backend les traite
+        par lots (requêtes groupées, connexion réutilisée...): la mémoire reste
+        constante quel que soit le nombre de paires. Un seul résumé est journalisé.
+
+        Args:
+            pairs (iterable): Paires (username, password)
+
+        Yields:
+            tuple: (username, bool) dans l'ordre des paires
+        """
+        return self._report_many(self._authenticate_many(pairs))
+
+    def _report_many(self, results: Iterator[Tuple[str, bool]]) -> Iterator[Tuple[str, bool]]:
+        """Relaie les résultats d'une vérification par lots et journalise un résumé à la fin"""
+        start = time.perf_counter()
+        total = accepted = 0
+        for username, ok in results:
+            total += 1
+            accepted += ok
+            yield username, ok
+        logger.debug(f"{type(self).__name__}.authenticate_many: {total} vérifications, "
+                     f"{accepted} acceptées en {time.perf_counter() - start:.2f}s")
+
+# Nombre de paires traitées par requête SQL
+_SQLITE_BATCH_SIZE = 500
+# Lots confiés à un pool et pas encore consommés, au maximum
+_MAX_PENDING_CHUNKS = 4
+
+def _chunks(pairs: Iterable[Tuple[str, str]], size: int) -> Iterator[List[Tuple[str, str]]]:
+    """Découpe un itérable en listes de taille bornée, sans le matérialiser"""
+    iterator = iter(pairs)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _hash_passwords(hash_algo: str, passwords: List[str]) -> List[str]:
+    """Hache une liste de mots de passe (fonction de module: transmissible à un pool de processus)"""
+    return [hashlib.new(hash_algo, password.encode()).hexdigest() for password in passwords]
+
 # --- Authentification simple (plain) ---
 class PlainAuthenticator(BaseAuthenticator):
     def __init__(self, users: Dict[str, str]):
         self.users = users
 
+    def _authenticate(self, username: str, password: str) -> bool:
+        return self.users.get(username) == password
+
     @log_function_call
     def authenticate(self, username: str, password: str) -> bool:
-        return self.users.get(username) == password
+        return self._authenticate(username, password)
 
 # --- Authentification sécurisée (hash) ---
 class SecureAuthenticator(BaseAuthenticator):
@@ -41,48 +109,385 @@ class SecureAuthenticator(BaseAuthenticator):
         self.users = users
         self.hash_algo = hash_algo
 
-    @log_function_call
-    def authenticate(self, username: str, password: str) -> bool:
+    def _authenticate(self, username: str, password: str) -> bool:
         hashed = hashlib.new(self.hash_algo, password.encode()).hexdigest()
         return self.users.get(username) == hashed
 
+    @log_function_call
+    def authenticate(self, username: str, password: str) -> bool:
+        return self._authenticate(username, password)
+
+    def authenticate_many(self, pairs: Iterable[Tuple[str, str]], executor: Optional[Executor] = None,
+                          chunk_size: int = 1000) -> Iterator[Tuple[str, bool]]:
+        """
+        Vérifie un grand nombre d'identifiants (voir BaseAuthenticator.authenticate_many)
+
+        Args:
+            pairs (iterable): Paires (username, password)
+            executor (Executor, optional): Pool (threads ou processus) calculant les hash par lots;
+                                           utile pour les algorithmes coûteux. Sans pool, le
+                                           calcul se fait dans le thread appelant.
+            chunk_size (int): Nombre de mots de passe par tâche du pool
+
+        Yields:
+            tuple: (username, bool) dans l'ordre des paires
+        """
+        if executor is None:
+            return super().authenticate_many(pairs)
+        return self._report_many(self._hash_in_pool(pairs, executor, chunk_size))
+
+    def _hash_in_pool(self, pairs: Iterable[Tuple[str, str]], executor: Executor,
+                      chunk_size: int) -> Iterator[Tuple[str, bool]]:
+        # Au plus _MAX_PENDING_CHUNKS lots en cours de calcul: la mémoire reste bornée
+        pending = collections.deque()
+        for chunk in _chunks(pairs, chunk_size):
+            pending.append((chunk, executor.submit(
+                _hash_passwords, self.hash_algo, [password for _, password in chunk])))
+            if len(pending) < _MAX_PENDING_CHUNKS:
+                continue
+            chunk, future = pending.popleft()
+            for (username, _), hashed in zip(chunk, future.result()):
+                yield username, self.users.get(username) == hashed
+        while pending:
+            chunk, future = pending.popleft()
+            for (username, _), hashed in zip(chunk, future.result()):
+                yield username, self.users.get(username) == hashed
+
 # --- Authentification base de données SQLite ---
 class SQLiteAuthenticator(BaseAuthenticator):
-    def __init__(self, db_path: str):
+    """
+    Authentification sur une table users(username, password) SQLite
+
+    Chaque thread réutilise sa propre connexion (ouverte au premier appel) au
+    lieu d'ouvrir une connexion par authentification; la requête étant
+    constante, sa forme préparée reste dans le cache de la connexion.
+    Utilisable comme context manager: close() ferme toutes les connexions.
+    """
+    _QUERY = "SELECT password FROM users WHERE username=?"
+
+    def __init__(self, db_path: str, read_only: bool = False, wal: bool = False,
+                 timeout: float = 5.0, cache_size_kib: int = 8192, mmap_size: int = 64 * 1024 * 1024):
+        """
+        Args:
+            db_path (str): Chemin de la base SQLite
+            read_only (bool): Ouvre la base en lecture seule (URI mode=ro, query_only)
+            wal (bool): Passe la base en journal WAL (lecteurs non bloqués par un écrivain).
+                        Changement persistant du fichier (fichiers -wal et -shm créés à
+                        côté): réservé aux bases dont l'application a la charge.
+                        Ignoré en lecture seule
+            timeout (float): Attente maximale d'un verrou de la base, en secondes
+            cache_size_kib (int): Taille du cache de pages par connexion, en Kio
+            mmap_size (int): Taille de la projection mémoire de la base, en octets (0: désactivée)
+        """
         self.db_path = db_path
+        self.read_only = read_only
+        self.wal = wal
+        self.timeout = timeout
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (thread propriétaire, connexion) pour close() et le nettoyage des threads terminés
+        self._connections = []
+        self._generation = 0
 
-    @log_function_call
-    def authenticate(self, username: str, password: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT password FROM users WHERE username=?", (username,))
-        row = cur.fetchone()
-        conn.close()
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=self.timeout, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+            if self.wal:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Renvoie la connexion du thread courant, ouverte au premier appel"""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None and local.generation == self._generation:
+            return conn
+        conn = self._connect()
+        current = threading.current_thread()
+        with self._lock:
+            # Fermer les connexions des threads terminés
+            alive = []
+            for thread, other in self._connections:
+                if thread.is_alive():
+                    alive.append((thread, other))
+                else:
+                    other.close()
+            alive.append((current, conn))
+            self._connections = alive
+            local.generation = self._generation
+        local.conn = conn
+        return conn
+
+    def _authenticate(self, username: str, password: str) -> bool:
+        row = self._get_connection().execute(self._QUERY, (username,)).fetchone()
         if row:
             return row[0] == password
         return False
 
+    @log_function_call
+    def authenticate(self, username: str, password: str) -> bool:
+        return self._authenticate(username, password)
+
+    def _authenticate_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        # Une requête IN (...) par lot (limite historique de 999 paramètres SQLite)
+        conn = self._get_connection()
+        for chunk in _chunks(pairs, _SQLITE_BATCH_SIZE):
+            usernames = list({username for username, _ in chunk})
+            placeholders = ",".join("?" * len(usernames))
+            rows = {}
+            for username, password in conn.execute(
+                    f"SELECT username, password FROM users WHERE username IN ({placeholders})", usernames):
+                # Première ligne par utilisateur, comme fetchone() dans _authenticate
+                rows.setdefault(username, password)
+            for username, password in chunk:
+                stored = rows.get(username)
+                yield username, stored is not None and stored == password
+
+    def close(self) -> None:
+        """Ferme toutes les connexions; un appel ultérieur à authenticate en rouvre une"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for _, conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Erreur lors de la fermeture d'une connexion SQLite: {e}")
+
+    def __enter__(self) -> "SQLiteAuthenticator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 # --- Authentification LDAP/AD/Azure ---
 class LDAPAuthenticator(BaseAuthenticator):
-    def __init__(self, server_uri: str, base_dn: str, user_template: str):
+    """
+    Authentification par bind LDAP (OpenLDAP, Active Directory, Azure AD DS)
+
+    L'objet Server est créé une seule fois et les informations DSE/schéma ne
+    sont lues qu'au premier bind réussi. Les vérifications réutilisent un pool
+    borné de connexions réauthentifiées par rebind, au lieu d'ouvrir une
+    connexion TCP par appel. Utilisable comme context manager: close() ferme le pool.
+    """
+
+    def __init__(self, server_uri: str, base_dn: str, user_template: str, pool_size: int = 4,
+                 connect_timeout: Optional[float] = 5.0, receive_timeout: Optional[float] = 10.0,
+                 pool_timeout: Optional[float] = None, health_check_interval: float = 60.0,
+                 get_info: str = "ALL", client_strategy: Optional[str] = None):
+        """
+        Args:
+            server_uri (str): URI du serveur (ex: "ldaps://ldap.exemple.com")
+            base_dn (str): DN de base
+            user_template (str): Modèle du DN utilisateur ({username}, {base_dn})
+            pool_size (int): Nombre maximal de connexions ouvertes simultanément
+            connect_timeout (float, optional): Délai d'ouverture d'une connexion, en secondes
+            receive_timeout (float, optional): Délai d'attente d'une réponse, en secondes
+            pool_timeout (float, optional): Attente maximale d'une connexion libre (None: illimitée)
+            health_check_interval (float): Une connexion inutilisée depuis plus longtemps est
+                                           vérifiée (recherche sur base_dn) avant d'être réutilisée
+            get_info (str): Informations lues au premier bind ("ALL", "SCHEMA", "DSA", "NO_INFO")
+            client_strategy (str, optional): Stratégie ldap3 (par défaut SYNC; MOCK_SYNC pour
+                                             tester sans annuaire, voir l'attribut server)
+        """
         if ldap3 is None:
             raise ImportError("ldap3 requis pour LDAPAuthenticator")
+        if pool_size < 1:
+            raise ValueError("pool_size doit être supérieur ou égal à 1")
         self.server_uri = server_uri
         self.base_dn = base_dn
         self.user_template = user_template
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.receive_timeout = receive_timeout
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
+        self.client_strategy = client_strategy or ldap3.SYNC
+        self.server = ldap3.Server(server_uri, get_info=get_info, connect_timeout=connect_timeout)
+        self._info_loaded = get_info == ldap3.NONE
+        # Connexions libres (connexion, instant de dernière utilisation): la plus récente d'abord
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._generation = 0
+
+    def _user_dn(self, username: str) -> str:
+        return self.user_template.format(username=username, base_dn=self.base_dn)
+
+    def _open(self) -> "ldap3.Connection":
+        # La connexion est ouverte par le premier bind
+        return ldap3.Connection(self.server, client_strategy=self.client_strategy,
+                                receive_timeout=self.receive_timeout)
+
+    @staticmethod
+    def _discard(conn: "ldap3.Connection") -> None:
+        try:
+            conn.unbind()
+        except LDAPException:
+            pass
+
+    def _ping(self, conn: "ldap3.Connection") -> bool:
+        """Vérifie que le serveur répond sur cette connexion (recherche BASE sur base_dn)"""
+        if conn.closed:
+            return False
+        try:
+            # Un refus (droits, DN absent) reste une réponse du serveur
+            conn.search(self.base_dn, "(objectClass=*)", search_scope=ldap3.BASE, attributes=["1.1"])
+        except LDAPCommunicationError:
+            return False
+        except LDAPException:
+            pass
+        return not conn.closed
+
+    def _acquire(self) -> Tuple[Optional["ldap3.Connection"], int]:
+        """
+        Réserve une place du pool et renvoie une connexion libre saine
+
+        Returns:
+            tuple: (connexion ou None s'il faut en ouvrir une, génération du pool)
+
+        Raises:
+            TimeoutError: Si aucune place ne s'est libérée avant pool_timeout
+        """
+        if not self._slots.acquire(timeout=self.pool_timeout):
+            raise TimeoutError(f"Aucune connexion LDAP libre après {self.pool_timeout}s")
+        generation = self._generation
+        while True:
+            try:
+                conn, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return None, generation
+            if conn.closed:
+                continue
+            if time.monotonic() - last_used < self.health_check_interval or self._ping(conn):
+                return conn, generation
+            self._discard(conn)
+
+    def _release(self, conn: Optional["ldap3.Connection"], generation: int) -> None:
+        try:
+            if conn is not None:
+                if conn.closed:
+                    pass
+                elif generation != self._generation:
+                    # Le pool a été fermé pendant l'utilisation de la connexion
+                    self._discard(conn)
+                else:
+                    self._idle.put((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def _bind_as(self, conn: Optional["ldap3.Connection"], user_dn: str,
+                 password: str) -> Tuple[Optional["ldap3.Connection"], bool]:
+        """
+        Réauthentifie la connexion; une connexion perdue est rouverte une fois
+
+        Returns:
+            tuple: (connexion à remettre dans le pool, résultat de l'authentification)
+        """
+        for attempt in range(2):
+            try:
+                if conn is None or conn.closed:
+                    conn = self._open()
+                ok = bool(conn.rebind(user=user_dn, password=password,
+                                      read_server_info=not self._info_loaded))
+                if ok:
+                    self._info_loaded = True
+                return conn, ok
+            except LDAPException as e:
+                if not conn.closed:
+                    # Identifiants refusés: la connexion reste utilisable
+                    return conn, False
+                if attempt:
+                    logger.warning(f"LDAP auth failed: {e}")
+                conn = None
+        return None, False
+
+    def _authenticate(self, username: str, password: str) -> bool:
+        if not password:
+            # Un bind sans mot de passe est anonyme et réussirait
+            return False
+        try:
+            conn, generation = self._acquire()
+        except TimeoutError as e:
+            logger.warning(f"LDAP auth failed: {e}")
+            return False
+        try:
+            conn, ok = self._bind_as(conn, self._user_dn(username), password)
+        finally:
+            self._release(conn, generation)
+        return ok
 
     @log_function_call
     def authenticate(self, username: str, password: str) -> bool:
-        from ldap3 import Server, Connection, ALL
-        server = Server(self.server_uri, get_info=ALL)
-        user_dn = self.user_template.format(username=username, base_dn=self.base_dn)
+        return self._authenticate(username, password)
+
+    def _authenticate_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        # Une seule connexion du pool, réauthentifiée pour chaque paire
         try:
-            conn = Connection(server, user=user_dn, password=password, auto_bind=True)
-            conn.unbind()
-            return True
-        except Exception as e:
+            conn, generation = self._acquire()
+        except TimeoutError as e:
             logger.warning(f"LDAP auth failed: {e}")
+            for username, _ in pairs:
+                yield username, False
+            return
+        try:
+            for username, password in pairs:
+                if not password:
+                    yield username, False
+                    continue
+                conn, ok = self._bind_as(conn, self._user_dn(username), password)
+                yield username, ok
+        finally:
+            self._release(conn, generation)
+
+    def check_health(self) -> bool:
+        """
+        Vérifie que l'annuaire répond, avec une connexion du pool
+
+        Returns:
+            bool: True si le serveur a répondu
+        """
+        try:
+            conn, generation = self._acquire()
+        except TimeoutError as e:
+            logger.warning(f"Vérification LDAP impossible: {e}")
             return False
+        try:
+            if conn is None:
+                conn = self._open()
+                conn.open()
+            healthy = self._ping(conn)
+        except LDAPException as e:
+            logger.warning(f"Serveur LDAP injoignable: {e}")
+            healthy = False
+        finally:
+            self._release(conn, generation)
+        return healthy
+
+    def close(self) -> None:
+        """Ferme les connexions libres; celles en cours d'utilisation le seront à leur libération"""
+        self._generation += 1
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def __enter__(self) -> "LDAPAuthenticator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 # --- Authentification SSO (OAuth2) [placeholders] ---
 class SSOAuthenticator(BaseAuthenticator):
@@ -97,25 +502,176 @@ class SSOAuthenticator(BaseAuthenticator):
         logger.warning("SSOAuthenticator: implémentation OAuth2 requise (placeholder)")
         return False
 
+    def _authenticate_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        logger.warning("SSOAuthenticator: implémentation OAuth2 requise (placeholder)")
+        for username, _ in pairs:
+            yield username, False
+
+# --- Cache d'authentification ---
+class _PendingCheck:
+    """Vérification en cours, partagée par les appels concurrents identiques"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = False
+        self.error = None
+
+class CachingAuthenticator(BaseAuthenticator):
+    """
+    Cache devant un authentificateur quelconque
+
+    Les clés sont un HMAC-SHA256 de (username, password) avec un secret
+    aléatoire propre à l'instance: aucun mot de passe n'est conservé en clair.
+    Succès et échecs ont des durées de vie distinctes, la taille est bornée
+    (LRU) et les vérifications identiques simultanées n'appellent le backend
+    qu'une fois.
+    """
+
+    def __init__(self, authenticator: BaseAuthenticator, positive_ttl: float = 300.0,
+                 negative_ttl: float = 30.0, max_entries: int = 10000):
+        """
+        Args:
+            authenticator (BaseAuthenticator): Authentificateur interrogé en cas d'absence du cache
+            positive_ttl (float): Durée de vie d'un succès, en secondes (0: non mis en cache)
+            negative_ttl (float): Durée de vie d'un échec, en secondes (0: non mis en cache)
+            max_entries (int): Nombre maximal d'entrées (les moins récemment utilisées sont évincées)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries doit être supérieur ou égal à 1")
+        self.authenticator = authenticator
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._secret = secrets.token_bytes(32)
+        # clé -> (username, résultat, expiration monotonic), du moins au plus récemment utilisé
+        self._entries = collections.OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        # Incrémenté à chaque invalidation: un résultat obtenu avant n'est pas mis en cache
+        self._epoch = 0
+
+    def _key(self, username: str, password: str) -> bytes:
+        message = b"%d:%s%s" % (len(username), username.encode(), password.encode())
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+    def _authenticate(self, username: str, password: str) -> bool:
+        key = self._key(username, password)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[2] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+            pending = self._pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._pending[key] = _PendingCheck()
+                epoch = self._epoch
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            pending.result = self.authenticator._authenticate(username, password)
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+                ttl = self.positive_ttl if pending.result else self.negative_ttl
+                if pending.error is None and ttl > 0 and epoch == self._epoch:
+                    self._entries[key] = (username, pending.result, time.monotonic() + ttl)
+                    if len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            pending.done.set()
+        return pending.result
+
+    @log_function_call
+    def authenticate(self, username: str, password: str) -> bool:
+        return self._authenticate(username, password)
+
+    def invalidate(self, username: Optional[str] = None) -> int:
+        """
+        Supprime les entrées d'un utilisateur (ex: après un changement de mot de passe)
+
+        Args:
+            username (str, optional): Utilisateur concerné (None: vide tout le cache)
+
+        Returns:
+            int: Nombre d'entrées supprimées
+        """
+        with self._lock:
+            self._epoch += 1
+            if username is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key, entry in self._entries.items() if entry[0] == username]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def close(self) -> None:
+        """Vide le cache et ferme l'authentificateur sous-jacent s'il le permet"""
+        self.invalidate()
+        close = getattr(self.authenticator, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "CachingAuthenticator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 # --- Factory pour choisir l'authentificateur ---
 @log_function_call
 def get_authenticator(method: str, **kwargs) -> BaseAuthenticator:
     """
     Retourne un authentificateur selon la méthode choisie.
     method: 'plain', 'secure', 'sqlite', 'ldap', 'sso'
-    kwargs: paramètres spécifiques à chaque backend
+    kwargs: paramètres spécifiques à chaque backend, et pour tous:
+        cache (bool): place un CachingAuthenticator devant le backend
+        cache_positive_ttl, cache_negative_ttl, cache_max_entries: réglages du cache
     """
+    authenticator = _create_authenticator(method, **kwargs)
+    if kwargs.get("cache", False):
+        return CachingAuthenticator(
+            authenticator,
+            positive_ttl=kwargs.get("cache_positive_ttl", 300.0),
+            negative_ttl=kwargs.get("cache_negative_ttl", 30.0),
+            max_entries=kwargs.get("cache_max_entries", 10000)
+        )
+    return authenticator
+
+def _create_authenticator(method: str, **kwargs) -> BaseAuthenticator:
     if method == "plain":
         return PlainAuthenticator(kwargs.get("users", {}))
     elif method == "secure":
         return SecureAuthenticator(kwargs.get("users", {}), kwargs.get("hash_algo", "sha256"))
     elif method == "sqlite":
-        return SQLiteAuthenticator(kwargs["db_path"])
+        return SQLiteAuthenticator(
+            kwargs["db_path"],
+            read_only=kwargs.get("read_only", False),
+            wal=kwargs.get("wal", False),
+            timeout=kwargs.get("timeout", 5.0)
+        )
     elif method == "ldap":
         return LDAPAuthenticator(
             kwargs["server_uri"],
             kwargs["base_dn"],
-            kwargs.get("user_template", "uid={username},{base_dn}")
+            kwargs.get("user_template", "uid={username},{base_dn}"),
+            pool_size=kwargs.get("pool_size", 4),
+            connect_timeout=kwargs.get("connect_timeout", 5.0),
+            receive_timeout=kwargs.get("receive_timeout", 10.0),
+            pool_timeout=kwargs.get("pool_timeout"),
+            health_check_interval=kwargs.get("health_check_interval", 60.0),
+            get_info=kwargs.get("get_info", "ALL"),
+            client_strategy=kwargs.get("client_strategy")
         )
     elif method == "sso":
         return SSOAuthenticator(
@@ -3,80 +3,561 @@ Module de gestion des configurations pour EndoriumUtils
 """
 
 import os
+import gc
 import sys
+import copy
 import json
-from typing import Dict, Any, Optional, Union
+import time
+import pickle
+import select
+import struct
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Union, Iterable, List, Tuple
 import tempfile
 import base64
 import hashlib
 import secrets
 
-from EndoriumUtils.log_utils import get_logger, log_function_call
-from EndoriumUtils.file_utils import safe_read_file, safe_write_file
+from EndoriumUtils.log_utils import get_lazy_logger, log_function_call
+from EndoriumUtils.file_utils import safe_read_file, safe_write_file, file_lock
 
-logger = get_logger("EndoriumUtils.config_utils")
+logger = get_lazy_logger("EndoriumUtils.config_utils")
 
-@log_function_call
-def load_config(config_path: str, default_config: Optional[Dict] = None, 
-                file_format: str = "auto") -> Dict[str, Any]:
+# Module yaml importé une seule fois (False s'il n'est pas installé)
+_yaml_module = None
+
+def _get_yaml():
+    """Renvoie le module yaml, ou None s'il n'est pas installé"""
+    global _yaml_module
+    if _yaml_module is None:
+        try:
+            import yaml  # Import conditionnel
+            _yaml_module = yaml
+        except ImportError:
+            _yaml_module = False
+    return _yaml_module or None
+
+# Backends JSON disponibles, par ordre de préférence pour 'auto'
+JSON_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+_json_backend = "json"
+_json_backend_cache = {}
+# Backends dont l'import a échoué: l'import n'est pas retenté à chaque appel
+_missing_json_backends = set()
+_missing_backends_warned = set()
+
+def _stdlib_json_dumps(config: Any, indent: Optional[int]) -> str:
+    if indent:
+        return json.dumps(config, indent=indent, ensure_ascii=False)
+    return json.dumps(config, ensure_ascii=False, separators=(",", ":"))
+
+def _build_json_backend(name: str):
+    """Renvoie (loads, dumps) d'un backend; dumps(config, indent) produit une str"""
+    if name == "json":
+        return json.loads, _stdlib_json_dumps
+    if name == "orjson":
+        import orjson
+
+        def dumps(config, indent):
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(config, option=option).decode("utf-8")
+        return orjson.loads, dumps
+    if name == "msgspec":
+        import msgspec
+
+        def dumps(config, indent):
+            data = msgspec.json.encode(config)
+            if indent:
+                data = msgspec.json.format(data, indent=indent)
+            return data.decode("utf-8")
+        return msgspec.json.decode, dumps
+    if name == "ujson":
+        import ujson
+
+        def dumps(config, indent):
+            return ujson.dumps(config, indent=indent or 0, ensure_ascii=False)
+        return ujson.loads, dumps
+    raise ValueError(f"Backend JSON inconnu: {name}")
+
+def _get_json_backend(name: Optional[str] = None):
+    """Renvoie (nom, loads, dumps) du backend demandé, du backend global si None"""
+    name = name or _json_backend
+    if name == "auto":
+        for candidate in JSON_BACKENDS:
+            if _is_json_backend_available(candidate):
+                name = candidate
+                break
+    backend = _json_backend_cache.get(name)
+    if backend is None:
+        backend = _json_backend_cache[name] = _build_json_backend(name)
+    return (name,) + backend
+
+def _is_json_backend_available(name: str) -> bool:
+    if name in _json_backend_cache:
+        return True
+    if name in _missing_json_backends:
+        return False
+    try:
+        _json_backend_cache[name] = _build_json_backend(name)
+        return True
+    except ImportError:
+        _missing_json_backends.add(name)
+        return False
+
+def _resolve_json_backend(name: Optional[str] = None) -> str:
     """
-    Charge une configuration depuis un fichier
+    Vérifie le backend demandé avant toute lecture ou écriture
+
+    Un backend non installé est remplacé par json (stdlib) avec un avertissement,
+    au lieu de faire échouer le chargement ou l'enregistrement du fichier.
+
+    Raises:
+        ValueError: Si le nom du backend est inconnu
+    """
+    name = name or _json_backend
+    if name != "auto" and name not in JSON_BACKENDS:
+        raise ValueError(f"Backend JSON inconnu: {name}")
+    if name == "auto" or _is_json_backend_available(name):
+        return name
+    if name not in _missing_backends_warned:
+        _missing_backends_warned.add(name)
+        logger.warning(f"Backend JSON {name} non installé, utilisation de json (stdlib)")
+    return "json"
+
+def get_available_json_backends() -> list:
+    """Renvoie les backends JSON installés (parmi orjson, msgspec, ujson, json)"""
+    return [name for name in JSON_BACKENDS if _is_json_backend_available(name)]
+
+def set_json_backend(name: str) -> str:
+    """
+    Choisit le backend JSON global de load_config/save_config
     
     Args:
-        config_path (str): Chemin du fichier de configuration
-        default_config (dict, optional): Configuration par défaut à utiliser si le fichier n'existe pas
-        file_format (str): Format du fichier ('json', 'yaml', 'auto' pour détection automatique)
+        name (str): 'json' (stdlib, défaut), 'orjson', 'msgspec', 'ujson' ou
+                    'auto' (le plus rapide installé); un backend non installé est
+                    remplacé par json avec un avertissement
         
     Returns:
-        dict: Configuration chargée ou configuration par défaut
-    """
-    if default_config is None:
-        default_config = {}
+        str: Nom du backend effectivement utilisé
         
-    # Détection du format si 'auto'
-    if file_format == "auto":
-        _, ext = os.path.splitext(config_path)
-        if ext.lower() in ('.yml', '.yaml'):
-            file_format = "yaml"
-        elif ext.lower() == '.json':
-            file_format = "json"
-        else:
-            file_format = "json"  # Format par défaut
-            
+    Raises:
+        ValueError: Si le nom du backend est inconnu
+    """
+    global _json_backend
+    name = _resolve_json_backend(name)
+    _json_backend = name
+    return _get_json_backend(name)[0]
+
+def _json_loads(content: str, backend: Optional[str] = None) -> Any:
+    """Analyse du JSON avec le backend choisi (repli sur la stdlib en cas de refus)"""
+    name, loads, _ = _get_json_backend(backend)
+    if name == "json":
+        return loads(content)
+    try:
+        return loads(content)
+    except Exception:
+        # Ex: NaN/Infinity acceptés par la stdlib mais pas par tous les backends
+        return json.loads(content)
+
+def _json_dumps(config: Any, indent: Optional[int], backend: Optional[str] = None) -> str:
+    """Sérialisation JSON avec le backend choisi (repli sur la stdlib pour les types non supportés)"""
+    name, _, dumps = _get_json_backend(backend)
+    if name == "orjson" and indent not in (None, 2):
+        # orjson ne sait indenter que sur 2 espaces
+        name, dumps = "json", _stdlib_json_dumps
+    if name == "json":
+        return dumps(config, indent)
+    try:
+        return dumps(config, indent)
+    except Exception:
+        return _stdlib_json_dumps(config, indent)
+
+def _yaml_safe_load(yaml, content: str) -> Any:
+    """yaml.safe_load avec le chargeur C (libyaml) s'il est disponible"""
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+def _yaml_safe_dump(yaml, config: Any, indent: Optional[int]) -> str:
+    """yaml.safe_dump avec le dumper C (libyaml) s'il est disponible"""
+    return yaml.dump(config, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                     indent=indent, allow_unicode=True, default_flow_style=False)
+
+def _detect_format(config_path: str, file_format: str) -> str:
+    """Détecte le format d'après l'extension si file_format vaut 'auto'"""
+    if file_format != "auto":
+        return file_format
+    _, ext = os.path.splitext(config_path)
+    if ext.lower() in ('.yml', '.yaml'):
+        return "yaml"
+    return "json"  # Format par défaut (et extension .json)
+
+def _parse_config(content: str, file_format: str, backend: Optional[str] = None) -> Optional[Any]:
+    """Analyse le contenu d'un fichier de configuration; None si le format n'est pas disponible"""
+    if file_format == "json":
+        return _json_loads(content, backend)
+    if file_format == "yaml":
+        yaml = _get_yaml()
+        if yaml is None:
+            logger.error("Module yaml non disponible. Installez-le avec 'pip install pyyaml'")
+            return None
+        return _yaml_safe_load(yaml, content)
+    logger.error(f"Format de configuration non supporté: {file_format}")
+    return None
+
+def _read_config(config_path: str, file_format: str, backend: Optional[str] = None) -> Optional[Any]:
+    """Lit et analyse un fichier de configuration; None s'il est absent, vide ou invalide"""
     try:
         if not os.path.exists(config_path):
             logger.warning(f"Fichier de configuration {config_path} non trouvé, utilisation des valeurs par défaut")
-            return default_config.copy()
+            return None
             
         content = safe_read_file(config_path)
         if not content:
-            return default_config.copy()
+            return None
+        return _parse_config(content, file_format, backend)
+    except Exception as e:
+        logger.error(f"Erreur lors du chargement de la configuration {config_path}: {str(e)}")
+        return None
+
+def _merge_config(default_config: Dict[str, Any], config: Optional[Any], 
+                  config_path: str) -> Dict[str, Any]:
+    """Fusionne une configuration analysée avec la configuration par défaut"""
+    if config is None:
+        return default_config.copy()
+    try:
+        # Fusionner avec la configuration par défaut pour garantir la structure,
+        # sans modifier les dictionnaires imbriqués de default_config
+        return _merge_copy(default_config, config)
+    except Exception as e:
+        logger.error(f"Erreur lors du chargement de la configuration {config_path}: {str(e)}")
+        return default_config.copy()
+
+def _freeze(value: Any) -> Any:
+    """Renvoie une vue en lecture seule (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def thaw_config(config: Any) -> Any:
+    """
+    Renvoie une copie modifiable d'une configuration en lecture seule
+    
+    Args:
+        config: Vue renvoyée par ConfigCache ou load_config(cache=True)
+        
+    Returns:
+        Copie composée de dict et de list
+    """
+    if isinstance(config, Mapping):
+        return {k: thaw_config(v) for k, v in config.items()}
+    if isinstance(config, (list, tuple)):
+        return [thaw_config(v) for v in config]
+    return config
+
+_MISSING = object()
+# Un fichier modifié moins de 2 s avant sa lecture peut encore changer sans que
+# sa signature stat ne bouge (granularité de mtime): il n'est pas servi depuis un cache
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+class _CacheEntry:
+    __slots__ = ("signature", "parsed", "defaults", "view")
+
+    def __init__(self, signature, parsed, defaults, view):
+        self.signature = signature
+        self.parsed = parsed
+        self.defaults = defaults
+        self.view = view
+
+class ConfigCache:
+    """
+    Cache LRU borné de configurations analysées et fusionnées
+
+    Chaque entrée est indexée par (chemin, format) et revalidée par un simple
+    os.stat: le fichier n'est relu et réanalysé que si sa date de modification,
+    sa taille ou son inode change, ou s'il a été modifié trop récemment pour que
+    sa date le prouve. Les configurations renvoyées sont des vues en lecture
+    seule (utiliser thaw_config pour obtenir une copie modifiable).
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, config_path: str, default_config: Optional[Dict] = None, 
+             file_format: str = "auto", backend: Optional[str] = None,
+             snapshot: bool = False) -> Mapping:
+        """
+        Charge une configuration en réutilisant la version en cache si le fichier n'a pas changé
+        
+        Args:
+            config_path (str): Chemin du fichier de configuration
+            default_config (dict, optional): Configuration par défaut
+            file_format (str): Format du fichier ('json', 'yaml', 'auto')
+            backend (str, optional): Backend JSON utilisé pour analyser le fichier
+            snapshot (bool): Si True, un fichier absent du cache est chargé via son
+                             snapshot binaire (voir load_config)
             
-        if file_format == "json":
-            config = json.loads(content)
-        elif file_format == "yaml":
+        Returns:
+            Mapping: Vue en lecture seule de la configuration fusionnée
+        """
+        if default_config is None:
+            default_config = {}
+        file_format = _detect_format(config_path, file_format)
+        key = (os.path.abspath(config_path), file_format)
+        racy = False
+        try:
+            st = os.stat(config_path)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+            racy = time.time_ns() - st.st_mtime_ns < _RACY_MTIME_WINDOW_NS
+        except OSError:
+            signature = None
+            
+        parsed = _MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not racy and entry.signature == signature:
+                self._entries.move_to_end(key)
+                if entry.defaults == default_config:
+                    return entry.view
+                # Seules les valeurs par défaut ont changé: pas besoin de relire le fichier
+                parsed = entry.parsed
+                
+        if parsed is _MISSING and snapshot:
+            # Le snapshot gère lui-même la fusion (parsed reste inconnu dans l'entrée)
+            merged = _load_with_snapshot(config_path, default_config, file_format, backend)
+        else:
+            if parsed is _MISSING:
+                parsed = _read_config(config_path, file_format, backend)
+            merged = _merge_config(default_config, parsed, config_path)
+        view = _freeze(merged)
+        
+        # Lu pendant la fenêtre de mtime: l'entrée ne sera jamais réutilisée telle quelle
+        stored_signature = _MISSING if racy else signature
+        with self._lock:
+            self._entries[key] = _CacheEntry(stored_signature, parsed, copy.deepcopy(default_config), view)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return view
+
+    def invalidate(self, config_path: Optional[str] = None) -> None:
+        """Oublie les entrées d'un fichier (ou toutes si config_path vaut None)"""
+        with self._lock:
+            if config_path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(config_path)
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._entries)
+
+# Cache partagé utilisé par load_config(cache=True)
+_default_config_cache = ConfigCache()
+
+# Snapshots binaires (pickle) écrits à côté des fichiers sources
+SNAPSHOT_SUFFIX = ".cache"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_PROTOCOL = max(pickle.DEFAULT_PROTOCOL, min(5, pickle.HIGHEST_PROTOCOL))
+# Une source modifiée moins de _RACY_MTIME_WINDOW_NS avant l'écriture du snapshot
+# est revérifiée par son hash
+
+# Suspension du ramasse-miettes partagée par les threads: seul le premier
+# entrant le désactive et seul le dernier sortant rétablit l'état initial
+_gc_pause_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+@contextmanager
+def _gc_paused():
+    """Suspend le ramasse-miettes (process-wide) le temps du bloc, sûr entre threads"""
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_pause_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_pause_lock:
+            _gc_pause_depth -= 1
+            if _gc_pause_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+def _snapshot_path(config_path: str) -> str:
+    return f"{config_path}{SNAPSHOT_SUFFIX}"
+
+def _defaults_digest(default_config: Dict[str, Any]) -> str:
+    return hashlib.sha256(pickle.dumps(default_config, protocol=_SNAPSHOT_PROTOCOL)).hexdigest()
+
+def _read_snapshot(config_path: str, file_format: str) -> Optional[Dict[str, Any]]:
+    """Lit le snapshot d'un fichier; None s'il est absent, corrompu ou d'un autre format"""
+    try:
+        with open(_snapshot_path(config_path), 'rb') as f:
+            data = f.read()
+        # Le ramasse-miettes est suspendu pendant la désérialisation de nombreux conteneurs
+        with _gc_paused():
+            snapshot = pickle.loads(data)
+        if (isinstance(snapshot, dict) and snapshot.get("version") == _SNAPSHOT_VERSION
+                and snapshot.get("format") == file_format):
+            return snapshot
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Snapshot de configuration illisible pour {config_path}, analyse normale: {str(e)}")
+    return None
+
+def _write_snapshot(config_path: str, file_format: str, source_sha256: str, parsed: Any,
+                    defaults_digest: Optional[str] = None, merged: Any = None) -> bool:
+    """Écrit le snapshot d'un fichier source (analyse et éventuellement fusion déjà faites)"""
+    try:
+        st = os.stat(config_path)
+        snapshot = {
+            "version": _SNAPSHOT_VERSION,
+            "format": file_format,
+            "written_ns": time.time_ns(),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": source_sha256,
+            "parsed": parsed,
+            "defaults": defaults_digest,
+            "merged": merged,
+        }
+        data = pickle.dumps(snapshot, protocol=_SNAPSHOT_PROTOCOL)
+    except Exception as e:
+        logger.warning(f"Impossible de créer le snapshot de {config_path}: {str(e)}")
+        return False
+    return safe_write_file(_snapshot_path(config_path), data)
+
+def _load_with_snapshot(config_path: str, default_config: Dict[str, Any], file_format: str,
+                        backend: Optional[str] = None) -> Dict[str, Any]:
+    """Charge une configuration via son snapshot binaire, recréé si la source a changé"""
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return _merge_config(default_config, _read_config(config_path, file_format, backend), config_path)
+        
+    snapshot = _read_snapshot(config_path, file_format)
+    source = None
+    source_sha256 = None
+    valid = False
+    if snapshot is not None:
+        if (st.st_mtime_ns == snapshot["mtime_ns"] and st.st_size == snapshot["size"]
+                and st.st_mtime_ns < snapshot["written_ns"] - _RACY_MTIME_WINDOW_NS):
+            valid = True
+        else:
+            # Date ou taille différente (ou trop récente): comparer le contenu
             try:
-                import yaml  # Import conditionnel
-                config = yaml.safe_load(content)
-            except ImportError:
-                logger.error("Module yaml non disponible. Installez-le avec 'pip install pyyaml'")
+                with open(config_path, 'rb') as f:
+                    source = f.read()
+            except OSError as e:
+                logger.error(f"Erreur lors du chargement de la configuration {config_path}: {str(e)}")
                 return default_config.copy()
-        else:
-            logger.error(f"Format de configuration non supporté: {file_format}")
-            return default_config.copy()
+            source_sha256 = hashlib.sha256(source).hexdigest()
+            valid = source_sha256 == snapshot["sha256"]
             
-        # Fusionner avec la configuration par défaut pour garantir la structure
-        merged_config = default_config.copy()
-        _deep_update(merged_config, config)
+    digest = _defaults_digest(default_config)
+    if valid:
+        if snapshot["defaults"] == digest:
+            merged = snapshot["merged"]
+        else:
+            merged = _merge_config(default_config, snapshot["parsed"], config_path)
+        if source is not None or snapshot["defaults"] != digest:
+            # Mettre à jour la signature et/ou la fusion mémorisées
+            _write_snapshot(config_path, file_format, snapshot["sha256"], snapshot["parsed"], digest, merged)
+        return merged
         
-        return merged_config
+    # Pas de snapshot valide: analyse normale puis écriture du snapshot
+    if source is None:
+        source = _read_bytes(config_path)
+    try:
+        parsed = _parse_config(source.decode("utf-8"), file_format, backend) if source else None
     except Exception as e:
         logger.error(f"Erreur lors du chargement de la configuration {config_path}: {str(e)}")
         return default_config.copy()
+    merged = _merge_config(default_config, parsed, config_path)
+    if parsed is not None:
+        if source_sha256 is None:
+            source_sha256 = hashlib.sha256(source).hexdigest()
+        _write_snapshot(config_path, file_format, source_sha256, parsed, digest, merged)
+    return merged
+
+def _read_bytes(config_path: str) -> bytes:
+    try:
+        with open(config_path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        logger.error(f"Erreur lors de la lecture du fichier {config_path}: {str(e)}")
+        return b""
+
+def get_config_cache() -> ConfigCache:
+    """Renvoie le cache de configurations partagé utilisé par load_config(cache=True)"""
+    return _default_config_cache
+
+@log_function_call
+def load_config(config_path: str, default_config: Optional[Dict] = None, 
+                file_format: str = "auto", cache: bool = False,
+                backend: Optional[str] = None, snapshot: bool = False) -> Dict[str, Any]:
+    """
+    Charge une configuration depuis un fichier
+    
+    Args:
+        config_path (str): Chemin du fichier de configuration
+        default_config (dict, optional): Configuration par défaut à utiliser si le fichier n'existe pas
+        file_format (str): Format du fichier ('json', 'yaml', 'auto' pour détection automatique)
+        cache (bool): Si True, utilise le cache partagé (voir ConfigCache): le fichier n'est
+                      réanalysé que s'il a changé et le résultat est en lecture seule;
+                      backend et snapshot s'appliquent aux lectures du fichier
+        backend (str, optional): Backend JSON ('json', 'orjson', 'msgspec', 'ujson', 'auto');
+                                 backend global (voir set_json_backend) si None; un backend
+                                 non installé est remplacé par json avec un avertissement
+        snapshot (bool): Si True, utilise un snapshot binaire (pickle) écrit à côté du
+                         fichier (config.json.cache): tant que la source n'a pas changé
+                         (date, taille, hash), analyse et fusion sont évitées. Un snapshot
+                         corrompu est ignoré. Réservé aux dossiers de confiance
+                         (pickle peut exécuter du code).
+        
+    Returns:
+        dict: Configuration chargée ou configuration par défaut
+        
+    Raises:
+        ValueError: Si le backend JSON est inconnu
+    """
+    if default_config is None:
+        default_config = {}
+        
+    # Détection du format si 'auto'
+    file_format = _detect_format(config_path, file_format)
+    if file_format == "json":
+        backend = _resolve_json_backend(backend)
+    
+    if cache:
+        return _default_config_cache.load(config_path, default_config, file_format, backend, snapshot)
+    if snapshot:
+        return _load_with_snapshot(config_path, default_config, file_format, backend)
+        
+    config = _read_config(config_path, file_format, backend)
+    return _merge_config(default_config, config, config_path)
 
 @log_function_call
 def save_config(config: Dict[str, Any], config_path: str, 
-                file_format: str = "auto", indent: int = 2) -> bool:
+                file_format: str = "auto", indent: int = 2,
+                backend: Optional[str] = None, compact: bool = False,
+                snapshot: bool = False, lock: bool = False,
+                lock_timeout: Optional[float] = None) -> bool:
     """
     Enregistre une configuration dans un fichier
     
@@ -85,39 +566,171 @@ def save_config(config: Dict[str, Any], config_path: str,
         config_path (str): Chemin du fichier de destination
         file_format (str): Format du fichier ('json', 'yaml', 'auto' pour détection automatique)
         indent (int): Indentation pour le formatage
+        backend (str, optional): Backend JSON ('json', 'orjson', 'msgspec', 'ujson', 'auto');
+                                 backend global (voir set_json_backend) si None; un backend
+                                 non installé est remplacé par json avec un avertissement
+        compact (bool): Si True, JSON sans indentation ni espaces (fichiers écrits par des machines)
+        snapshot (bool): Si True, écrit aussi le snapshot binaire lu par load_config(snapshot=True)
+        lock (bool): Si True, écrit (fichier et snapshot) sous file_lock(config_path);
+                     réentrant pour un load/modification/save déjà protégé par l'appelant
+        lock_timeout (float, optional): Attente maximale du verrou, en secondes (None: illimitée)
         
     Returns:
         bool: True si l'enregistrement a réussi
+        
+    Raises:
+        ValueError: Si le backend JSON est inconnu
     """
     # Détection du format si 'auto'
-    if file_format == "auto":
-        _, ext = os.path.splitext(config_path)
-        if ext.lower() in ('.yml', '.yaml'):
-            file_format = "yaml"
-        elif ext.lower() == '.json':
-            file_format = "json"
-        else:
-            file_format = "json"  # Format par défaut
+    file_format = _detect_format(config_path, file_format)
+    if file_format == "json":
+        backend = _resolve_json_backend(backend)
+    
+    # Les vues en lecture seule du cache sont reconverties en dict
+    if isinstance(config, MappingProxyType):
+        config = thaw_config(config)
     
     try:
         if file_format == "json":
-            content = json.dumps(config, indent=indent, ensure_ascii=False)
+            content = _json_dumps(config, None if compact else indent, backend)
         elif file_format == "yaml":
-            try:
-                import yaml  # Import conditionnel
-                content = yaml.safe_dump(config, indent=indent, allow_unicode=True)
-            except ImportError:
+            yaml = _get_yaml()
+            if yaml is None:
                 logger.error("Module yaml non disponible. Installez-le avec 'pip install pyyaml'")
                 return False
+            content = _yaml_safe_dump(yaml, config, indent)
         else:
             logger.error(f"Format de configuration non supporté: {file_format}")
             return False
             
-        return safe_write_file(config_path, content, create_backup=True)
+        with file_lock(config_path, timeout=lock_timeout) if lock else nullcontext():
+            if not safe_write_file(config_path, content, create_backup=True):
+                return False
+            if snapshot:
+                # Relire le contenu sérialisé garantit un snapshot identique à une analyse du fichier
+                _write_snapshot(config_path, file_format, hashlib.sha256(content.encode("utf-8")).hexdigest(),
+                                _parse_config(content, file_format, backend))
+        return True
     except Exception as e:
         logger.error(f"Erreur lors de l'enregistrement de la configuration {config_path}: {str(e)}")
         return False
 
+class KeyPath:
+    """
+    Chemin de clé compilé (notation en points), réutilisable sans redécoupage
+
+    Les accès par KeyPath ne passent pas par le décorateur de log: c'est
+    l'API à utiliser sur les chemins critiques (ex: feature flags par requête).
+    """
+    __slots__ = ("path", "parts")
+
+    def __init__(self, key_path: str):
+        self.path = key_path
+        self.parts = tuple(key_path.split('.'))
+
+    def get(self, config: Mapping, default_value: Any = None) -> Any:
+        """
+        Récupère la valeur du chemin dans une configuration
+        
+        Args:
+            config (dict): Configuration dans laquelle chercher
+            default_value (any): Valeur par défaut si la clé n'est pas trouvée
+            
+        Returns:
+            any: Valeur trouvée ou valeur par défaut
+        """
+        current = config
+        for part in self.parts:
+            # Test de type exact d'abord: bien plus rapide que isinstance sur un ABC
+            if type(current) is not dict and not isinstance(current, Mapping):
+                return default_value
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
+                return default_value
+        return current
+
+    def set(self, config: Dict[str, Any], value: Any) -> Dict[str, Any]:
+        """
+        Définit la valeur du chemin dans une configuration (les niveaux manquants sont créés)
+        
+        Args:
+            config (dict): Configuration à modifier
+            value (any): Valeur à définir
+            
+        Returns:
+            dict: Configuration modifiée
+        """
+        current = config
+        
+        # Parcourir la hiérarchie sauf le dernier élément
+        for part in self.parts[:-1]:
+            child = current.get(part)
+            if not isinstance(child, dict):
+                child = current[part] = {}
+            current = child
+            
+        # Définir la valeur pour le dernier élément
+        current[self.parts[-1]] = value
+        return config
+
+    def __repr__(self):
+        return f"KeyPath({self.path!r})"
+
+@functools.lru_cache(maxsize=1024)
+def compile_key_path(key_path: str) -> KeyPath:
+    """
+    Compile un chemin de clé en notation en points (résultat mémoïsé)
+    
+    Args:
+        key_path (str): Chemin de la clé (ex: "section.sous_section.valeur")
+        
+    Returns:
+        KeyPath: Accesseur réutilisable (méthodes get et set)
+    """
+    return KeyPath(key_path)
+
+_LEAF = object()
+
+@functools.lru_cache(maxsize=256)
+def _compile_key_path_tree(key_paths: tuple) -> dict:
+    """Construit (et mémoïse) l'arbre des préfixes communs d'un ensemble de chemins"""
+    tree = {}
+    for key_path in key_paths:
+        node = tree
+        for part in compile_key_path(key_path).parts:
+            node = node.setdefault(part, {})
+        node[_LEAF] = key_path
+    return tree
+
+def _collect_values(node: dict, current: Any, results: Dict[str, Any]) -> None:
+    """Parcourt la configuration en suivant l'arbre des chemins"""
+    for part, child in node.items():
+        if part is _LEAF:
+            results[child] = current
+        elif isinstance(current, Mapping):
+            value = current.get(part, _MISSING)
+            if value is not _MISSING:
+                _collect_values(child, value, results)
+
+def get_config_values(config: Mapping, key_paths, default_value: Any = None) -> Dict[str, Any]:
+    """
+    Récupère plusieurs valeurs en un seul parcours de la configuration
+    
+    Les préfixes communs (ex: "db.host" et "db.port") ne sont parcourus qu'une fois.
+    
+    Args:
+        config (dict): Configuration dans laquelle chercher
+        key_paths (iterable): Chemins des clés en notation en points
+        default_value (any): Valeur pour les clés non trouvées
+        
+    Returns:
+        dict: Valeur (ou valeur par défaut) par chemin de clé
+    """
+    key_paths = tuple(key_paths)
+    found = {}
+    _collect_values(_compile_key_path_tree(key_paths), config, found)
+    return {key_path: found.get(key_path, default_value) for key_path in key_paths}
+
 @log_function_call
 def get_config_value(config: Dict[str, Any], key_path: str, default_value: Any = None) -> Any:
     """
@@ -131,15 +744,8 @@ def get_config_value(config: Dict[str, Any], key_path: str, default_value: Any =
     Returns:
         any: Valeur trouvée ou valeur par défaut
     """
-    parts = key_path.split('.')
-    current = config
-    
     try:
-        for part in parts:
-            if not isinstance(current, dict) or part not in current:
-                return default_value
-            current = current[part]
-        return current
+        return compile_key_path(key_path).get(config, default_value)
     except Exception:
         return default_value
 
@@ -156,18 +762,7 @@ def set_config_value(config: Dict[str, Any], key_path: str, value: Any) -> Dict[
     Returns:
         dict: Configuration modifiée
     """
-    parts = key_path.split('.')
-    current = config
-    
-    # Parcourir la hiérarchie sauf le dernier élément
-    for i, part in enumerate(parts[:-1]):
-        if part not in current or not isinstance(current[part], dict):
-            current[part] = {}
-        current = current[part]
-        
-    # Définir la valeur pour le dernier élément
-    current[parts[-1]] = value
-    return config
+    return compile_key_path(key_path).set(config, value)
 
 def _deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
     """Mise à jour profonde d'un dictionnaire avec un autre"""
@@ -178,40 +773,599 @@ def _deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, An
             target[key] = value
     return target
 
-def set_password(config: Dict[str, Any], key_path: str, password: str, iterations: int = 100_000) -> Dict[str, Any]:
+def _merge_copy(base: Mapping, override: Mapping) -> Dict[str, Any]:
     """
-    Stocke un mot de passe de façon sécurisée (hash PBKDF2 + sel) dans la configuration.
-    Le résultat est une chaîne base64 contenant le sel et le hash.
+    Fusion profonde sans modifier les entrées (copie sur écriture)
+
+    Seuls les dictionnaires situés sur les chemins fusionnés sont copiés; les
+    sous-arbres non modifiés sont partagés avec base et override.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key, _MISSING)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged[key] = _merge_copy(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+class LayeredConfig(Mapping):
+    """
+    Configuration en couches résolue paresseusement
+
+    Les couches (ex: défauts, fichier du site, fichier d'environnement,
+    variables d'environnement) restent séparées, de la moins prioritaire à la
+    plus prioritaire. Une lecture parcourt les couches comme un ChainMap, en
+    fusionnant les sous-dictionnaires, et le résultat est mis en cache par
+    chemin de clé jusqu'à la prochaine modification. Les modifications sont
+    faites par copie sur écriture: les dictionnaires fournis ne sont jamais
+    modifiés et une couche peut être remplacée sans refusionner les autres.
+    Les valeurs renvoyées sont en lecture seule (voir thaw_config).
+
+    Exemple:
+        config = LayeredConfig(defaults, site, names=["defaults", "site"])
+        config.add_layer("env", config_from_env("APP_"))
+        host = config.get("database.host")
+    """
+
+    def __init__(self, *layers: Mapping, names: Optional[list] = None):
+        """
+        Args:
+            *layers (dict): Couches, de la moins prioritaire à la plus prioritaire
+            names (list, optional): Noms des couches (par défaut "layer0", "layer1", ...)
+        """
+        if names is None:
+            names = [f"layer{i}" for i in range(len(layers))]
+        if len(names) != len(layers):
+            raise ValueError("Le nombre de noms doit correspondre au nombre de couches")
+        self._names = list(names)
+        self._layers = list(layers)
+        self._cache = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def layer_names(self) -> list:
+        """Noms des couches, de la moins prioritaire à la plus prioritaire"""
+        return list(self._names)
+
+    def layer(self, name: str) -> Mapping:
+        """Renvoie le contenu d'une couche"""
+        return self._layers[self._index(name)]
+
+    def _index(self, name: str) -> int:
+        try:
+            return self._names.index(name)
+        except ValueError:
+            raise KeyError(f"Couche de configuration inconnue: {name}") from None
+
+    def _invalidate(self) -> None:
+        # Appelé sous le verrou
+        self._cache = {}
+        self._generation += 1
+
+    def add_layer(self, name: str, layer: Mapping) -> None:
+        """Ajoute une couche au-dessus des autres (la plus prioritaire)"""
+        with self._lock:
+            if name in self._names:
+                raise ValueError(f"Couche de configuration déjà présente: {name}")
+            self._names.append(name)
+            self._layers.append(layer)
+            self._invalidate()
+
+    def replace_layer(self, name: str, layer: Mapping) -> None:
+        """Remplace le contenu d'une couche sans toucher aux autres"""
+        with self._lock:
+            self._layers[self._index(name)] = layer
+            self._invalidate()
+
+    def remove_layer(self, name: str) -> None:
+        """Supprime une couche"""
+        with self._lock:
+            index = self._index(name)
+            del self._names[index]
+            del self._layers[index]
+            self._invalidate()
+
+    def _resolve(self, parts: tuple) -> Any:
+        """Résout un chemin à travers les couches (_MISSING si absent)"""
+        mappings = []
+        for layer in reversed(self._layers):
+            value = layer
+            shadowed = False
+            for part in parts:
+                if not isinstance(value, Mapping):
+                    # Une valeur simple sur le chemin masque les couches inférieures
+                    shadowed = True
+                    break
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
+                    break
+            if shadowed:
+                break
+            if value is _MISSING:
+                continue
+            if not isinstance(value, Mapping):
+                # Une valeur simple masque les couches inférieures
+                if not mappings:
+                    return _freeze(value)
+                break
+            mappings.append(value)
+        if not mappings:
+            return _MISSING
+        merged = mappings[-1]
+        for mapping in reversed(mappings[:-1]):
+            merged = _merge_copy(merged, mapping)
+        return _freeze(dict(merged))
+
+    def _lookup(self, parts: tuple) -> Any:
+        cache = self._cache
+        value = cache.get(parts, _MISSING)
+        if value is _MISSING and parts not in cache:
+            generation = self._generation
+            value = self._resolve(parts)
+            with self._lock:
+                # Ne pas mettre en cache un résultat calculé avant une modification
+                if generation == self._generation:
+                    self._cache[parts] = value
+        return value
+
+    def get(self, key_path: str, default_value: Any = None) -> Any:
+        """
+        Récupère une valeur en notation en points à travers les couches
+        
+        Args:
+            key_path (str): Chemin de la clé (ex: "section.sous_section.valeur")
+            default_value (any): Valeur par défaut si la clé n'est dans aucune couche
+            
+        Returns:
+            any: Valeur (en lecture seule) ou valeur par défaut
+        """
+        value = self._lookup(compile_key_path(key_path).parts)
+        return default_value if value is _MISSING else value
+
+    def set(self, key_path: str, value: Any, layer: Optional[str] = None) -> None:
+        """
+        Définit une valeur dans une couche, par copie sur écriture
+        
+        Args:
+            key_path (str): Chemin de la clé (ex: "section.sous_section.valeur")
+            value (any): Valeur à définir
+            layer (str, optional): Couche à modifier (la plus prioritaire si None)
+        """
+        parts = compile_key_path(key_path).parts
+        with self._lock:
+            if not self._layers:
+                raise KeyError("Aucune couche de configuration")
+            index = len(self._layers) - 1 if layer is None else self._index(layer)
+            # Copier uniquement les dictionnaires situés sur le chemin modifié
+            root = dict(self._layers[index])
+            current = root
+            for part in parts[:-1]:
+                child = current.get(part)
+                child = dict(child) if isinstance(child, Mapping) else {}
+                current[part] = child
+                current = child
+            current[parts[-1]] = value
+            self._layers[index] = root
+            self._invalidate()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Aplatit toutes les couches en un dictionnaire indépendant et modifiable"""
+        merged = {}
+        for layer in list(self._layers):
+            merged = _merge_copy(merged, layer)
+        return thaw_config(merged)
+
+    def __getitem__(self, key):
+        value = self._lookup((key,))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        seen = {}
+        for layer in list(self._layers):
+            for key in layer:
+                seen.setdefault(key, None)
+        return iter(seen)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"LayeredConfig(layers={self._names!r})"
+
+def config_from_env(prefix: str, separator: str = "__", 
+                    environ: Optional[Mapping] = None) -> Dict[str, Any]:
+    """
+    Construit une couche de configuration depuis des variables d'environnement
+    
+    Ex: APP_DATABASE__PORT=5432 avec le préfixe "APP_" donne {"database": {"port": 5432}}.
+    Les valeurs JSON (nombres, booléens, listes...) sont décodées, les autres restent des chaînes.
+    
     Args:
-        config (dict): Configuration à modifier
-        key_path (str): Chemin de la clé (ex: "auth.admin_password")
-        password (str): Mot de passe en clair à stocker
-        iterations (int): Nombre d'itérations PBKDF2 (défaut: 100_000)
+        prefix (str): Préfixe des variables à prendre en compte
+        separator (str): Séparateur entre niveaux dans le nom de la variable
+        environ (dict, optional): Variables à utiliser (os.environ si None)
+        
     Returns:
-        dict: Configuration modifiée
+        dict: Couche de configuration imbriquée
+    """
+    if environ is None:
+        environ = os.environ
+    layer = {}
+    for name, raw in environ.items():
+        if not name.startswith(prefix) or len(name) == len(prefix):
+            continue
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        parts = name[len(prefix):].lower().split(separator)
+        current = layer
+        for part in parts[:-1]:
+            child = current.get(part)
+            if not isinstance(child, dict):
+                child = current[part] = {}
+            current = child
+        current[parts[-1]] = value
+    return layer
+
+def _diff_key_paths(old: Any, new: Any, prefix: str = "") -> list:
+    """Renvoie les chemins (notation en points) dont la valeur diffère entre deux configurations"""
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        changed = []
+        for key in old.keys() | new.keys():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if key not in old or key not in new:
+                changed.append(path)
+            elif old[key] is not new[key]:
+                changed.extend(_diff_key_paths(old[key], new[key], path))
+        return sorted(changed)
+    if old != new:
+        return [prefix]
+    return []
+
+# Constantes inotify (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+class _InotifySource:
+    """Source d'événements inotify (Linux) sur les dossiers des fichiers surveillés"""
+
+    def __init__(self, paths):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._watches = {}
+        self._names = {}
+        for path in paths:
+            directory, name = os.path.split(path)
+            self._names.setdefault(directory, {})[name] = path
+        for directory in self._names:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), _INOTIFY_MASK)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch {directory}")
+            self._watches[wd] = directory
+        # Tube permettant à stop() de réveiller le thread immédiatement
+        self._wake_r, self._wake_w = os.pipe()
+
+    def wait(self, timeout):
+        """Attend des événements; renvoie l'ensemble des fichiers surveillés concernés"""
+        ready, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        changed = set()
+        if self._fd in ready:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                path = self._names.get(self._watches.get(wd), {}).get(name)
+                if path is not None:
+                    changed.add(path)
+        return changed
+
+    def wake(self):
+        os.write(self._wake_w, b"\0")
+
+    def close(self):
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+class _StatPollSource:
+    """Source de secours par sondage os.stat, à intervalle adaptatif
+
+    L'intervalle double (jusqu'à max_interval) tant que rien ne change et
+    revient à min_interval dès qu'un changement est détecté.
+    """
+
+    def __init__(self, paths, min_interval, max_interval):
+        self._paths = list(paths)
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._interval = min_interval
+        self._wake_event = threading.Event()
+        self._signatures = {path: _stat_signature(path) for path in self._paths}
+
+    def wait(self, timeout):
+        """Attend au plus timeout (ou l'intervalle courant); renvoie les fichiers modifiés"""
+        delay = self._interval if timeout is None else min(timeout, self._interval)
+        self._wake_event.wait(delay)
+        changed = set()
+        for path in self._paths:
+            signature = _stat_signature(path)
+            if signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed.add(path)
+        if changed:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * 2, self._max_interval)
+        return changed
+
+    def wake(self):
+        self._wake_event.set()
+
+    def close(self):
+        pass
+
+def _stat_signature(path: str):
+    """Signature (mtime_ns, taille, inode) d'un fichier, None s'il n'existe pas"""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        return None
+
+class ConfigWatcher:
+    """
+    Surveille des fichiers de configuration et les recharge à chaud
+
+    Les changements sont détectés par inotify quand il est disponible, sinon
+    par un sondage os.stat adaptatif. Les rafales d'écritures (ex: écriture
+    d'un .tmp puis renommage, comme safe_write_file) sont regroupées (debounce).
+    L'analyse se fait dans un thread d'arrière-plan; la nouvelle configuration
+    fusionnée remplace l'ancienne de façon atomique, les lecteurs ne paient
+    qu'une lecture de référence. Un fichier illisible ou supprimé conserve la
+    dernière configuration valide.
+
+    Exemple:
+        watcher = ConfigWatcher("config.json", default_config)
+        watcher.subscribe(lambda path, config, changed: print(changed))
+        watcher.start()
+        debug = watcher.config["app"]["debug"]
     """
+
+    def __init__(self, config_paths, default_config: Optional[Dict] = None,
+                 file_format: str = "auto", debounce: float = 0.2,
+                 poll_interval: float = 0.5, max_poll_interval: float = 5.0,
+                 use_inotify: bool = True):
+        """
+        Args:
+            config_paths (str or list): Fichier(s) de configuration à surveiller
+            default_config (dict, optional): Configuration par défaut fusionnée avec chaque fichier
+            file_format (str): Format des fichiers ('json', 'yaml', 'auto')
+            debounce (float): Délai de calme (en secondes) avant de recharger après un changement
+            poll_interval (float): Intervalle de sondage minimal (mode sans inotify)
+            max_poll_interval (float): Intervalle de sondage maximal (mode sans inotify)
+            use_inotify (bool): Si False, force le mode par sondage
+        """
+        if isinstance(config_paths, str):
+            config_paths = [config_paths]
+        self.default_config = default_config if default_config is not None else {}
+        self.file_format = file_format
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.use_inotify = use_inotify
+        self._paths = [os.path.abspath(path) for path in config_paths]
+        self._subscribers = []
+        self._reload_lock = threading.Lock()
+        self._thread = None
+        self._source = None
+        self._stop_event = threading.Event()
+        self._configs = {}
+        for path in self._paths:
+            self._configs[path] = _freeze(self._load(path) or
+                                          _merge_config(self.default_config, None, path))
+
+    @property
+    def config(self) -> Mapping:
+        """Configuration courante du premier fichier surveillé (lecture seule)"""
+        return self._configs[self._paths[0]]
+
+    def get(self, config_path: Optional[str] = None) -> Mapping:
+        """
+        Renvoie la configuration courante d'un fichier surveillé (lecture seule)
+        
+        Args:
+            config_path (str, optional): Fichier surveillé; le premier si None
+        """
+        if config_path is None:
+            return self._configs[self._paths[0]]
+        return self._configs[os.path.abspath(config_path)]
+
+    def subscribe(self, callback):
+        """
+        Abonne un callback aux rechargements
+        
+        Args:
+            callback (callable): Appelé avec (chemin, nouvelle configuration, chemins de clés modifiés)
+            
+        Returns:
+            callable: Le callback (utilisable comme décorateur)
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        """Désabonne un callback"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        """Analyse et fusionne un fichier; None s'il est absent ou invalide"""
+        parsed = _read_config(path, _detect_format(path, self.file_format))
+        if parsed is None:
+            return None
+        return _merge_config(self.default_config, parsed, path)
+
+    def reload(self, config_path: Optional[str] = None) -> list:
+        """
+        Recharge immédiatement un fichier et notifie les abonnés s'il a changé
+        
+        Args:
+            config_path (str, optional): Fichier à recharger; le premier si None
+            
+        Returns:
+            list: Chemins de clés modifiés (vide si rien n'a changé)
+        """
+        path = self._paths[0] if config_path is None else os.path.abspath(config_path)
+        with self._reload_lock:
+            merged = self._load(path)
+            if merged is None:
+                logger.warning(f"Rechargement de {path} ignoré, conservation de la configuration précédente")
+                return []
+            new_config = _freeze(merged)
+            changed = _diff_key_paths(self._configs[path], new_config)
+            if not changed:
+                return []
+            # Remplacement atomique: les lecteurs voient l'ancien ou le nouveau dictionnaire
+            configs = dict(self._configs)
+            configs[path] = new_config
+            self._configs = configs
+        logger.info(f"Configuration {path} rechargée ({len(changed)} clé(s) modifiée(s))")
+        for callback in list(self._subscribers):
+            try:
+                callback(path, new_config, changed)
+            except Exception as e:
+                logger.error(f"Erreur dans un abonné de ConfigWatcher: {str(e)}")
+        return changed
+
+    def _create_source(self):
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                return _InotifySource(self._paths)
+            except Exception as e:
+                logger.debug(f"inotify indisponible ({e}), sondage os.stat utilisé")
+        return _StatPollSource(self._paths, self.poll_interval, self.max_poll_interval)
+
+    def _run(self):
+        pending = set()
+        deadline = None
+        while not self._stop_event.is_set():
+            timeout = None
+            if pending:
+                timeout = max(deadline - time.monotonic(), 0)
+            changed = self._source.wait(timeout)
+            if self._stop_event.is_set():
+                break
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + self.debounce
+            elif pending and time.monotonic() >= deadline:
+                for path in sorted(pending):
+                    try:
+                        self.reload(path)
+                    except Exception as e:
+                        logger.error(f"Erreur lors du rechargement de {path}: {str(e)}")
+                pending.clear()
+
+    def start(self) -> "ConfigWatcher":
+        """Démarre la surveillance dans un thread d'arrière-plan"""
+        if self._thread is None:
+            self._stop_event.clear()
+            self._source = self._create_source()
+            self._thread = threading.Thread(target=self._run, name="EndoriumUtils-config-watcher",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Arrête la surveillance"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._source.wake()
+            self._thread.join()
+            self._source.close()
+            self._thread = None
+            self._source = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+# Pool de calcul des hash PBKDF2 (créé au premier appel asynchrone ou par lot)
+_password_executor = None
+_password_executor_owned = False
+_password_executor_lock = threading.Lock()
+
+def _get_password_executor() -> Executor:
+    global _password_executor, _password_executor_owned
+    if _password_executor is None:
+        with _password_executor_lock:
+            if _password_executor is None:
+                # pbkdf2_hmac libère le GIL: un thread par processeur suffit
+                _password_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                        thread_name_prefix="EndoriumUtils-password")
+                _password_executor_owned = True
+    return _password_executor
+
+def set_password_executor(executor: Optional[Executor]) -> None:
+    """
+    Choisit le pool utilisé par les fonctions de mot de passe asynchrones et par lot
+
+    Args:
+        executor (Executor, optional): ThreadPoolExecutor ou ProcessPoolExecutor fourni par
+                                       l'appelant (qui reste chargé de l'arrêter);
+                                       None: pool de threads interne (un thread par processeur)
+    """
+    global _password_executor, _password_executor_owned
+    with _password_executor_lock:
+        previous, owned = _password_executor, _password_executor_owned
+        _password_executor, _password_executor_owned = executor, False
+    if previous is not None and owned:
+        previous.shutdown(wait=False)
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    """PBKDF2-HMAC-SHA256 (fonction de module: transmissible à un pool de processus)"""
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+def _hash_password(password: str, iterations: int) -> Dict[str, Any]:
+    """Calcule l'entrée {salt, hash, iterations, algo} stockée dans la configuration"""
     salt = secrets.token_bytes(16)
-    hash_bytes = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
-    data = {
+    hash_bytes = _pbkdf2(password, salt, iterations)
+    return {
         "salt": base64.b64encode(salt).decode("utf-8"),
         "hash": base64.b64encode(hash_bytes).decode("utf-8"),
         "iterations": iterations,
         "algo": "pbkdf2_sha256"
     }
-    set_config_value(config, key_path, data)
-    return config
 
-def verify_password(config: Dict[str, Any], key_path: str, password: str) -> bool:
-    """
-    Vérifie un mot de passe par rapport à la valeur stockée dans la configuration.
-    Args:
-        config (dict): Configuration à lire
-        key_path (str): Chemin de la clé (ex: "auth.admin_password")
-        password (str): Mot de passe à vérifier
-    Returns:
-        bool: True si le mot de passe est correct, False sinon
-    """
-    data = get_config_value(config, key_path)
+def _check_password(data: Any, password: str) -> bool:
+    """Compare un mot de passe à une entrée {salt, hash, iterations, algo}"""
     if not isinstance(data, dict):
         return False
     try:
@@ -222,8 +1376,124 @@ def verify_password(config: Dict[str, Any], key_path: str, password: str) -> boo
         if algo != "pbkdf2_sha256":
             logger.error(f"Algorithme non supporté: {algo}")
             return False
-        hash_test = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+        hash_test = _pbkdf2(password, salt, iterations)
         return secrets.compare_digest(hash_stored, hash_test)
     except Exception as e:
         logger.error(f"Erreur lors de la vérification du mot de passe: {str(e)}")
         return False
+
+def set_password(config: Dict[str, Any], key_path: str, password: str, iterations: int = 100_000) -> Dict[str, Any]:
+    """
+    Stocke un mot de passe de façon sécurisée (hash PBKDF2 + sel) dans la configuration.
+    Le résultat est une chaîne base64 contenant le sel et le hash.
+    Args:
+        config (dict): Configuration à modifier
+        key_path (str): Chemin de la clé (ex: "auth.admin_password")
+        password (str): Mot de passe en clair à stocker
+        iterations (int): Nombre d'itérations PBKDF2 (défaut: 100_000)
+    Returns:
+        dict: Configuration modifiée
+    """
+    set_config_value(config, key_path, _hash_password(password, iterations))
+    return config
+
+def verify_password(config: Dict[str, Any], key_path: str, password: str) -> bool:
+    """
+    Vérifie un mot de passe par rapport à la valeur stockée dans la configuration.
+    Args:
+        config (dict): Configuration à lire
+        key_path (str): Chemin de la clé (ex: "auth.admin_password")
+        password (str): Mot de passe à vérifier
+    Returns:
+        bool: True si le mot de passe est correct, False sinon
+    """
+    return _check_password(get_config_value(config, key_path), password)
+
+async def set_password_async(config: Dict[str, Any], key_path: str, password: str,
+                             iterations: int = 100_000, executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    Version asynchrone de set_password: le hash est calculé dans le pool
+    (voir set_password_executor), la boucle d'événements n'est pas bloquée.
+    Args:
+        executor (Executor, optional): Pool à utiliser pour cet appel
+    Returns:
+        dict: Configuration modifiée
+    """
+    import asyncio  # Import différé: coûteux, inutile aux autres fonctions du module
+    loop = asyncio.get_running_loop()
+    data = await loop.run_in_executor(executor or _get_password_executor(),
+                                      _hash_password, password, iterations)
+    set_config_value(config, key_path, data)
+    return config
+
+async def verify_password_async(config: Dict[str, Any], key_path: str, password: str,
+                                executor: Optional[Executor] = None) -> bool:
+    """
+    Version asynchrone de verify_password (hash calculé dans le pool).
+    Args:
+        executor (Executor, optional): Pool à utiliser pour cet appel
+    Returns:
+        bool: True si le mot de passe est correct, False sinon
+    """
+    import asyncio  # Import différé: coûteux, inutile aux autres fonctions du module
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _get_password_executor(),
+                                      _check_password, get_config_value(config, key_path), password)
+
+def set_passwords(config: Dict[str, Any], passwords: Dict[str, str], iterations: int = 100_000,
+                  executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    Stocke plusieurs mots de passe, hash calculés en parallèle dans le pool.
+    Args:
+        config (dict): Configuration à modifier
+        passwords (dict): Mot de passe en clair par chemin de clé
+        iterations (int): Nombre d'itérations PBKDF2
+        executor (Executor, optional): Pool à utiliser pour cet appel
+    Returns:
+        dict: Configuration modifiée
+    """
+    key_paths = list(passwords)
+    pool = executor or _get_password_executor()
+    entries = pool.map(_hash_password, [passwords[key_path] for key_path in key_paths],
+                       [iterations] * len(key_paths))
+    for key_path, data in zip(key_paths, entries):
+        set_config_value(config, key_path, data)
+    return config
+
+def verify_passwords(config: Dict[str, Any], checks: Iterable[Tuple[str, str]],
+                     executor: Optional[Executor] = None) -> List[bool]:
+    """
+    Vérifie plusieurs mots de passe en parallèle dans le pool.
+    Args:
+        config (dict): Configuration à lire
+        checks (iterable): Paires (chemin de clé, mot de passe)
+        executor (Executor, optional): Pool à utiliser pour cet appel
+    Returns:
+        list: Résultats, dans l'ordre des paires
+    """
+    checks = list(checks)
+    pool = executor or _get_password_executor()
+    return list(pool.map(_check_password, [get_config_value(config, key_path) for key_path, _ in checks],
+                         [password for _, password in checks]))
+
+def calibrate_pbkdf2_iterations(target_ms: float = 100.0, minimum: int = 100_000,
+                                sample_iterations: int = 20_000) -> int:
+    """
+    Détermine le nombre d'itérations PBKDF2 donnant la latence visée sur cette machine.
+    Args:
+        target_ms (float): Durée visée d'un hash, en millisecondes
+        minimum (int): Nombre d'itérations minimal renvoyé, quelle que soit la machine
+        sample_iterations (int): Itérations de la mesure (meilleur de 3 essais)
+    Returns:
+        int: Nombre d'itérations, arrondi au millier inférieur, à passer à set_password
+    """
+    salt = secrets.token_bytes(16)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        _pbkdf2("calibration", salt, sample_iterations)
+        best = min(best, time.perf_counter() - start)
+    iterations = int(sample_iterations * (target_ms / 1000.0) / best) // 1000 * 1000
+    logger.debug(f"PBKDF2: {sample_iterations} itérations en {best * 1000:.1f}ms, "
+                 f"{iterations} itérations pour {target_ms}ms")
+    return max(minimum, iterations)
@@ -3,17 +3,30 @@ Module de gestion des fichiers pour EndoriumUtils
 """
 
 import os
+import stat
 import shutil
 import hashlib
+import secrets
+import tempfile
+import threading
 import time
 import json
+import mmap
+import fnmatch
 from pathlib import Path
-from contextlib import contextmanager
-from typing import Union, Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Union, Optional, Dict, Any, List, Iterable, Iterator
 
-from EndoriumUtils.log_utils import get_logger, log_function_call
+from EndoriumUtils.log_utils import get_lazy_logger, log_function_call
 
-logger = get_logger("EndoriumUtils.file_utils")
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = get_lazy_logger("EndoriumUtils.file_utils")
 
 @log_function_call
 def ensure_dir_exists(directory: str) -> bool:
@@ -60,44 +73,342 @@ def safe_read_file(file_path: str, default_content: str = "", encoding: str = "u
         logger.error(f"Erreur lors de la lecture du fichier {file_path}: {str(e)}")
         return default_content
 
-@log_function_call
-def safe_write_file(file_path: str, content: str, encoding: str = "utf-8", 
-                    create_backup: bool = False) -> bool:
+# Taille des blocs pour les lectures en flux: mémoire constante quelle que soit
+# la taille du fichier
+_STREAM_CHUNK_SIZE = 1 << 20
+
+def iter_lines(file_path: str, encoding: str = "utf-8", 
+               errors: Optional[str] = None) -> Iterator[str]:
     """
-    Écrit du contenu dans un fichier de manière sécurisée
+    Lit un fichier texte ligne par ligne, sans le charger entièrement en mémoire
     
     Args:
-        file_path (str): Chemin du fichier à écrire
-        content (str): Contenu à écrire
+        file_path (str): Chemin du fichier à lire
         encoding (str): Encodage à utiliser
-        create_backup (bool): Si True, crée une sauvegarde avant l'écriture
+        errors (str, optional): Gestion des erreurs de décodage (voir open())
+        
+    Yields:
+        str: Lignes du fichier (avec leur fin de ligne); rien si le fichier n'existe pas
+        
+    Raises:
+        OSError, UnicodeDecodeError: Erreur survenue en cours de lecture (journalisée)
+    """
+    try:
+        with open(file_path, 'r', encoding=encoding, errors=errors, 
+                  buffering=_STREAM_CHUNK_SIZE) as f:
+            yield from f
+    except FileNotFoundError:
+        logger.warning(f"Le fichier {file_path} n'existe pas, aucune ligne lue")
+    except Exception as e:
+        logger.error(f"Erreur lors de la lecture du fichier {file_path}: {str(e)}")
+        raise
+
+def iter_chunks(file_path: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Lit un fichier binaire par blocs de taille fixe
+    
+    Args:
+        file_path (str): Chemin du fichier à lire
+        chunk_size (int): Taille maximale de chaque bloc, en octets
+        
+    Yields:
+        bytes: Blocs successifs du fichier; rien si le fichier n'existe pas
+        
+    Raises:
+        OSError: Erreur survenue en cours de lecture (journalisée)
+    """
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    except FileNotFoundError:
+        logger.warning(f"Le fichier {file_path} n'existe pas, aucun bloc lu")
+    except Exception as e:
+        logger.error(f"Erreur lors de la lecture du fichier {file_path}: {str(e)}")
+        raise
+
+@log_function_call
+def read_bytes_view(file_path: str) -> Optional[memoryview]:
+    """
+    Projette un fichier en mémoire (lecture seule) et renvoie une vue sans copie
+    
+    Les pages ne sont lues qu'à l'accès. La projection reste valide tant que la
+    vue existe; `with read_bytes_view(path) as view:` la libère à la sortie.
+    
+    Args:
+        file_path (str): Chemin du fichier à lire
         
     Returns:
-        bool: True si l'écriture a réussi
+        memoryview or None: Vue sur le contenu du fichier ou None en cas d'erreur
     """
     try:
-        # Créer le répertoire parent si nécessaire
-        directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuse les fichiers vides
+                return memoryview(b"")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)
+    except FileNotFoundError:
+        logger.warning(f"Le fichier {file_path} n'existe pas")
+        return None
+    except Exception as e:
+        logger.error(f"Erreur lors de la projection du fichier {file_path}: {str(e)}")
+        return None
+
+LOCK_SUFFIX = ".lock"
+
+# Verrous détenus par le thread courant: chemin du .lock -> [fd, shared, profondeur]
+_held_locks = threading.local()
+
+def _try_lock(fd: int, shared: bool) -> bool:
+    """Tente de poser le verrou sans bloquer; renvoie False s'il est déjà pris"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:
+            # msvcrt ne connaît que les verrous exclusifs (sur le premier octet)
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except BlockingIOError:
+        return False
+    except OSError:
+        # msvcrt signale un verrou déjà pris par EACCES/EDEADLOCK
+        if fcntl is None:
+            return False
+        raise
+
+def _unlock(fd: int) -> None:
+    """Libère le verrou posé par _try_lock"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def file_lock(path: str, shared: bool = False, timeout: Optional[float] = None,
+              poll_interval: float = 0.001, max_poll_interval: float = 0.05):
+    """
+    Verrou consultatif inter-processus sur un fichier (lecteurs/écrivain)
+    
+    Le verrou porte sur un fichier annexe `<path>.lock` et non sur le fichier
+    lui-même, que les écritures atomiques remplacent par un nouvel inode.
+    Basé sur fcntl.flock: des threads d'un même processus s'excluent aussi
+    mutuellement, sans verrou global. Réentrant dans un même thread.
+    
+    Args:
+        path (str): Chemin du fichier à protéger
+        shared (bool): Si True, verrou partagé (lecteurs); sinon exclusif (écrivain)
+        timeout (float, optional): Attente maximale en secondes (None: illimitée, 0: un seul essai)
+        poll_interval (float): Premier intervalle d'attente entre deux essais, doublé à chaque échec
+        max_poll_interval (float): Intervalle d'attente maximal entre deux essais
+        
+    Raises:
+        TimeoutError: Si le verrou n'a pas pu être obtenu dans le délai imparti
+        RuntimeError: Si le thread détient déjà un verrou partagé et demande un verrou exclusif
+    """
+    lock_path = os.path.abspath(f"{path}{LOCK_SUFFIX}")
+    held = getattr(_held_locks, "locks", None)
+    if held is None:
+        held = _held_locks.locks = {}
+        
+    entry = held.get(lock_path)
+    if entry is not None:
+        if entry[1] and not shared:
+            raise RuntimeError(f"Impossible de promouvoir un verrou partagé en verrou exclusif: {path}")
+        entry[2] += 1
+        try:
+            yield
+        finally:
+            entry[2] -= 1
+        return
+        
+    directory = os.path.dirname(lock_path)
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+        while not _try_lock(fd, shared):
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Verrou non obtenu après {timeout}s: {lock_path}")
+                time.sleep(min(delay, remaining))
+            else:
+                time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
             
-        # Créer une sauvegarde si demandé et si le fichier existe
-        if create_backup and os.path.exists(file_path):
-            backup_path = f"{file_path}.bak"
+        held[lock_path] = [fd, shared, 1]
+        try:
+            yield
+        finally:
+            del held[lock_path]
+            _unlock(fd)
+    finally:
+        # Le fichier .lock n'est jamais supprimé: un autre processus peut l'avoir ouvert
+        os.close(fd)
+
+# Permissions par défaut des nouveaux fichiers (0o666 moins l'umask), calculées une fois
+_new_file_mode = None
+_new_file_mode_lock = threading.Lock()
+
+def _get_new_file_mode() -> int:
+    """Renvoie les permissions qu'aurait un fichier créé par open()"""
+    global _new_file_mode
+    if _new_file_mode is None:
+        with _new_file_mode_lock:
+            if _new_file_mode is None:
+                umask = None
+                try:
+                    # Lecture sans modifier l'umask du processus (Linux >= 4.7)
+                    with open("/proc/self/status") as f:
+                        for line in f:
+                            if line.startswith("Umask:"):
+                                umask = int(line.split()[1], 8)
+                                break
+                except (OSError, ValueError):
+                    pass
+                if umask is None:
+                    umask = os.umask(0o022)
+                    os.umask(umask)
+                _new_file_mode = 0o666 & ~umask
+    return _new_file_mode
+
+def _fsync_directory(directory: str) -> None:
+    """Force l'écriture sur disque d'une entrée de répertoire (POSIX uniquement)"""
+    if os.name != "posix":
+        return
+    fd = os.open(directory or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _backup_file(file_path: str, backup_path: str) -> None:
+    """
+    Crée une sauvegarde par lien physique (aucun octet copié)
+
+    Le fichier original étant ensuite remplacé par renommage (nouvel inode),
+    le lien conserve l'ancien contenu. Repli sur une copie si le système de
+    fichiers ne supporte pas les liens physiques.
+    """
+    temp_link = f"{backup_path}.{secrets.token_hex(8)}.tmp"
+    try:
+        for _ in range(5):
+            try:
+                os.link(file_path, temp_link)
+                os.replace(temp_link, backup_path)
+                return
+            except FileNotFoundError:
+                # Inode remplacé par un écrivain concurrent pendant link(): réessayer
+                continue
+            except OSError:
+                break
+        try:
             shutil.copy2(file_path, backup_path)
-            logger.debug(f"Backup créé: {backup_path}")
-            
-        # Écriture sécurisée (écrire d'abord dans un fichier temporaire)
-        temp_path = f"{file_path}.tmp"
-        with open(temp_path, 'w', encoding=encoding) as f:
-            f.write(content)
-            
-        # Remplacer le fichier original
-        if os.path.exists(file_path):
-            os.replace(temp_path, file_path)
+        except shutil.SameFileError:
+            # La sauvegarde pointe déjà sur le contenu actuel
+            pass
+    finally:
+        # rename() ne fait rien si les deux noms désignent déjà le même inode
+        try:
+            os.remove(temp_link)
+        except FileNotFoundError:
+            pass
+
+def _atomic_write(file_path: str, write, binary: bool, encoding: str = "utf-8",
+                  create_backup: bool = False, fsync: bool = False) -> None:
+    """
+    Écrit un fichier de façon atomique (fichier temporaire unique puis os.replace)
+
+    Args:
+        file_path (str): Chemin du fichier à écrire
+        write (callable): Reçoit l'objet fichier temporaire ouvert et y écrit le contenu
+        binary (bool): Ouvre le fichier temporaire en mode binaire
+        encoding (str): Encodage en mode texte
+        create_backup (bool): Si True, sauvegarde le fichier existant en .bak
+        fsync (bool): Si True, force l'écriture sur disque du fichier et du répertoire
+    """
+    # Créer le répertoire parent si nécessaire
+    directory = os.path.dirname(file_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+        
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        exists = True
+    except FileNotFoundError:
+        mode = _get_new_file_mode()
+        exists = False
+        
+    # Créer une sauvegarde si demandé et si le fichier existe
+    if create_backup and exists:
+        backup_path = f"{file_path}.bak"
+        _backup_file(file_path, backup_path)
+        logger.debug(f"Backup créé: {backup_path}")
+        
+    # Fichier temporaire unique dans le même répertoire: pas de collision entre
+    # écrivains concurrents et os.replace reste atomique (même système de fichiers)
+    fd, temp_path = tempfile.mkstemp(dir=directory or ".", 
+                                     prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        if binary:
+            f = os.fdopen(fd, 'wb')
         else:
-            os.rename(temp_path, file_path)
-            
+            f = os.fdopen(fd, 'w', encoding=encoding)
+        with f:
+            write(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+        
+    if fsync:
+        _fsync_directory(directory)
+
+@log_function_call
+def safe_write_file(file_path: str, content: Union[str, bytes, bytearray, memoryview], encoding: str = "utf-8", 
+                    create_backup: bool = False, fsync: bool = False,
+                    lock: bool = False, lock_timeout: Optional[float] = None) -> bool:
+    """
+    Écrit du contenu dans un fichier de manière sécurisée
+    
+    Le contenu est écrit dans un fichier temporaire unique du même répertoire
+    puis substitué atomiquement: un lecteur voit l'ancien ou le nouveau contenu,
+    jamais un fichier partiel, et des écrivains concurrents ne se marchent pas dessus.
+    
+    Args:
+        file_path (str): Chemin du fichier à écrire
+        content (str or bytes-like): Contenu à écrire (bytes, bytearray ou memoryview: écriture binaire)
+        encoding (str): Encodage à utiliser (ignoré pour du contenu binaire)
+        create_backup (bool): Si True, crée une sauvegarde (.bak, par lien physique) avant l'écriture
+        fsync (bool): Si True, force l'écriture sur disque (fichier et répertoire) pour
+                      survivre à un crash, au prix de la latence
+        lock (bool): Si True, écrit sous file_lock(file_path) pour sérialiser les écrivains
+                     concurrents (processus ou threads)
+        lock_timeout (float, optional): Attente maximale du verrou, en secondes (None: illimitée)
+        
+    Returns:
+        bool: True si l'écriture a réussi (False aussi si le verrou n'a pas été obtenu à temps)
+    """
+    try:
+        with file_lock(file_path, timeout=lock_timeout) if lock else nullcontext():
+            _atomic_write(file_path, lambda f: f.write(content),
+                          isinstance(content, (bytes, bytearray, memoryview)),
+                          encoding, create_backup, fsync)
         logger.debug(f"Fichier écrit avec succès: {file_path}")
         return True
     except Exception as e:
@@ -105,33 +416,240 @@ def safe_write_file(file_path: str, content: str, encoding: str = "utf-8",
         return False
 
 @log_function_call
-def get_file_hash(file_path: str, algorithm: str = "sha256") -> Optional[str]:
+def safe_write_stream(file_path: str, chunks: Iterable[Union[str, bytes]], encoding: str = "utf-8",
+                      create_backup: bool = False, fsync: bool = False,
+                      lock: bool = False, lock_timeout: Optional[float] = None) -> bool:
     """
-    Calcule le hash d'un fichier
+    Écrit un flux de blocs dans un fichier, de manière atomique
+    
+    Même chemin que safe_write_file (fichier temporaire unique puis remplacement):
+    les blocs sont écrits au fur et à mesure, sans jamais assembler le contenu
+    complet en mémoire. Si l'itérable lève une exception, le fichier d'origine
+    est conservé intact.
     
     Args:
-        file_path (str): Chemin du fichier
-        algorithm (str): Algorithme de hachage (md5, sha1, sha256, etc.)
+        file_path (str): Chemin du fichier à écrire
+        chunks (iterable): Blocs str ou bytes (le type du premier bloc fixe le mode d'écriture)
+        encoding (str): Encodage à utiliser (ignoré pour des blocs bytes)
+        create_backup (bool): Si True, crée une sauvegarde (.bak) avant l'écriture
+        fsync (bool): Si True, force l'écriture sur disque (fichier et répertoire)
+        lock (bool): Si True, écrit sous file_lock(file_path)
+        lock_timeout (float, optional): Attente maximale du verrou, en secondes (None: illimitée)
         
     Returns:
-        str or None: Hash du fichier ou None en cas d'erreur
+        bool: True si l'écriture a réussi
     """
-    if not os.path.exists(file_path):
-        logger.warning(f"Le fichier {file_path} n'existe pas")
-        return None
-        
     try:
-        hash_obj = hashlib.new(algorithm)
+        chunks = iter(chunks)
+        first = next(chunks, "")
         
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                hash_obj.update(chunk)
+        def _write(f):
+            f.write(first)
+            for chunk in chunks:
+                f.write(chunk)
                 
-        return hash_obj.hexdigest()
+        with file_lock(file_path, timeout=lock_timeout) if lock else nullcontext():
+            _atomic_write(file_path, _write, isinstance(first, (bytes, bytearray, memoryview)),
+                          encoding, create_backup, fsync)
+        logger.debug(f"Fichier écrit avec succès: {file_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Erreur lors de l'écriture du fichier {file_path}: {str(e)}")
+        return False
+
+# Lecture par blocs de 1 Mio dans un tampon réutilisé (readinto, sans copie);
+# au-delà du seuil, le fichier est projeté en mémoire et haché en un seul appel
+_HASH_BUFFER_SIZE = 1 << 20
+_HASH_MMAP_THRESHOLD = 64 << 20
+
+# Un fichier modifié moins de 2 s avant son hachage peut encore changer sans que
+# sa date ne bouge (granularité du système de fichiers): il n'est pas mis en cache
+_HASH_CACHE_RACY_WINDOW_NS = 2_000_000_000
+
+def _compute_file_hash(file_path: str, algorithm: str, size: Optional[int] = None) -> str:
+    """Calcule le hash d'un fichier (hashlib libère le GIL pendant le calcul)"""
+    hash_obj = hashlib.new(algorithm)
+    with open(file_path, 'rb', buffering=0) as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= _HASH_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
+        else:
+            buffer = bytearray(min(_HASH_BUFFER_SIZE, max(size, 1)))
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                hash_obj.update(view[:n])
+    return hash_obj.hexdigest()
+
+def _hash_file_or_none(file_path: str, algorithm: str, 
+                       cache: Optional["FileHashCache"] = None) -> Optional[str]:
+    """Calcule (ou relit depuis le cache) le hash d'un fichier; None en cas d'erreur"""
+    try:
+        if cache is not None:
+            return cache._lookup(file_path, algorithm)
+        return _compute_file_hash(file_path, algorithm)
+    except FileNotFoundError:
+        logger.warning(f"Le fichier {file_path} n'existe pas")
+        return None
     except Exception as e:
         logger.error(f"Erreur lors du calcul du hash pour {file_path}: {str(e)}")
         return None
 
+class FileHashCache:
+    """
+    Cache des hash de fichiers, persistant sur disque (JSON)
+    
+    Chaque entrée est indexée par (chemin, algorithme) et validée par
+    (inode, taille, mtime_ns): un fichier inchangé n'est jamais relu.
+    Utilisable comme context manager (sauvegarde à la sortie).
+    """
+    
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Args:
+            cache_path (str, optional): Fichier JSON de persistance (None: cache en mémoire)
+        """
+        self.cache_path = cache_path
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if cache_path:
+            self._load()
+            
+    def _load(self) -> None:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            entries = {}
+            for algorithm, files in data.get("entries", {}).items():
+                for path, (ino, size, mtime_ns, digest) in files.items():
+                    entries[(path, algorithm)] = (ino, size, mtime_ns, digest)
+            self._entries = entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Cache de hash illisible, ignoré: {self.cache_path} ({str(e)})")
+            
+    def _lookup(self, file_path: str, algorithm: str) -> str:
+        """Renvoie le hash en cache s'il est encore valide, sinon le calcule (lève en cas d'erreur)"""
+        key = (os.path.abspath(file_path), algorithm)
+        st = os.stat(file_path)
+        signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[:3] == signature:
+            return entry[3]
+            
+        # La signature est prise avant la lecture: une modification pendant le
+        # calcul change la date et invalide l'entrée au prochain accès
+        digest = _compute_file_hash(file_path, algorithm, st.st_size)
+        if st.st_mtime_ns < time.time_ns() - _HASH_CACHE_RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[key] = signature + (digest,)
+                self._dirty = True
+        return digest
+        
+    def get(self, file_path: str, algorithm: str = "sha256") -> Optional[str]:
+        """
+        Renvoie le hash d'un fichier, relu depuis le cache si le fichier n'a pas changé
+        
+        Args:
+            file_path (str): Chemin du fichier
+            algorithm (str): Algorithme de hachage
+            
+        Returns:
+            str or None: Hash du fichier ou None en cas d'erreur
+        """
+        return _hash_file_or_none(file_path, algorithm, self)
+        
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """Supprime les entrées d'un fichier (ou toutes si file_path est None)"""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                path = os.path.abspath(file_path)
+                for key in [k for k in self._entries if k[0] == path]:
+                    del self._entries[key]
+            self._dirty = True
+            
+    def save(self) -> bool:
+        """
+        Enregistre le cache dans cache_path (écriture atomique, sous verrou de fichier)
+        
+        Returns:
+            bool: True si le cache est à jour sur disque
+        """
+        if not self.cache_path or not self._dirty:
+            return True
+        with self._lock:
+            data = {}
+            for (path, algorithm), entry in self._entries.items():
+                data.setdefault(algorithm, {})[path] = list(entry)
+            self._dirty = False
+        content = json.dumps({"version": 1, "entries": data}, separators=(",", ":"))
+        if not safe_write_file(self.cache_path, content, lock=True):
+            self._dirty = True
+            return False
+        return True
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def __enter__(self) -> "FileHashCache":
+        return self
+        
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.save()
+
+@log_function_call
+def get_file_hash(file_path: str, algorithm: str = "sha256", 
+                  cache: Optional[FileHashCache] = None) -> Optional[str]:
+    """
+    Calcule le hash d'un fichier
+    
+    Args:
+        file_path (str): Chemin du fichier
+        algorithm (str): Algorithme de hachage (md5, sha1, sha256, etc.)
+        cache (FileHashCache, optional): Cache consulté avant de relire le fichier
+        
+    Returns:
+        str or None: Hash du fichier ou None en cas d'erreur
+    """
+    return _hash_file_or_none(file_path, algorithm, cache)
+
+@log_function_call
+def hash_files(paths: List[str], algorithm: str = "sha256", workers: Optional[int] = None,
+               cache: Optional[FileHashCache] = None) -> Dict[str, Optional[str]]:
+    """
+    Calcule le hash de plusieurs fichiers en parallèle
+    
+    hashlib libérant le GIL pendant le calcul, un pool de threads exploite
+    plusieurs cœurs et recouvre les lectures disque.
+    
+    Args:
+        paths (list): Chemins des fichiers
+        algorithm (str): Algorithme de hachage
+        workers (int, optional): Nombre de threads (défaut: nombre de processeurs;
+                                 1: calcul séquentiel, sans pool)
+        cache (FileHashCache, optional): Cache consulté avant de relire chaque fichier
+        
+    Returns:
+        dict: Hash par chemin (None pour les fichiers en erreur), dans l'ordre de paths
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return {path: _hash_file_or_none(path, algorithm, cache) for path in paths}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="EndoriumUtils-hash") as executor:
+        digests = executor.map(lambda path: _hash_file_or_none(path, algorithm, cache), paths)
+        return dict(zip(paths, digests))
+
 @log_function_call
 def is_file_newer_than(file_path: str, reference_time: Union[float, int]) -> bool:
     """
@@ -153,3 +671,254 @@ def is_file_newer_than(file_path: str, reference_time: Union[float, int]) -> boo
     except Exception as e:
         logger.error(f"Erreur lors de la vérification de la date de {file_path}: {str(e)}")
         return False
+
+class SnapshotDiff:
+    """
+    Différences entre deux DirectorySnapshot (chemins relatifs à la racine)
+
+    errors contient les fichiers et sous-dossiers présents mais illisibles lors
+    du scan: leur contenu est inconnu, ils ne sont ni supprimés ni (sauf ajout)
+    modifiés.
+    """
+    __slots__ = ("added", "removed", "modified", "errors")
+
+    def __init__(self, added=None, removed=None, modified=None, errors=None):
+        self.added = set(added or ())
+        self.removed = set(removed or ())
+        self.modified = set(modified or ())
+        self.errors = set(errors or ())
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self) -> str:
+        return (f"SnapshotDiff(added={len(self.added)}, removed={len(self.removed)}, "
+                f"modified={len(self.modified)}, errors={len(self.errors)})")
+
+class DirectorySnapshot:
+    """
+    Empreinte d'une arborescence de fichiers, persistable dans un manifeste JSON
+    
+    Chaque fichier est décrit par sa signature stat (taille, mtime_ns, inode)
+    et, si demandé, par le hash de son contenu. Un nouveau scan comparé au
+    précédent ne relit que les fichiers dont la signature a changé.
+    """
+    MANIFEST_VERSION = 1
+
+    def __init__(self, root: str, files: Optional[Dict[str, tuple]] = None,
+                 algorithm: Optional[str] = "sha256", scanned_ns: int = 0):
+        """
+        Args:
+            root (str): Racine de l'arborescence
+            files (dict, optional): Chemin relatif -> (taille, mtime_ns, inode, hash ou None);
+                                    hash None avec un algorithme: fichier illisible lors du scan
+            algorithm (str, optional): Algorithme de hachage (None: signatures stat seulement)
+            scanned_ns (int): Date du scan (time.time_ns)
+        """
+        self.root = os.path.abspath(root)
+        self.files = files if files is not None else {}
+        self.algorithm = algorithm
+        self.scanned_ns = scanned_ns
+        # Sous-dossiers illisibles lors du scan (non enregistré dans le manifeste)
+        self.unreadable = set()
+
+    @staticmethod
+    def _walk(root: str, ignore: Optional[List[str]]) -> tuple:
+        """
+        Parcourt l'arborescence avec os.scandir
+        
+        Returns:
+            tuple: (chemin relatif -> signature, préfixes relatifs des sous-dossiers illisibles)
+            
+        Raises:
+            OSError: Si la racine elle-même est illisible
+        """
+        signatures = {}
+        unreadable = set()
+        stack = [("", root)]
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if ignore and any(fnmatch.fnmatch(entry.name, pattern) for pattern in ignore):
+                            continue
+                        relative = prefix + entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((relative + "/", entry.path))
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                signatures[relative] = (st.st_size, st.st_mtime_ns, st.st_ino)
+                        except OSError:
+                            # Entrée supprimée pendant le parcours
+                            continue
+            except OSError as e:
+                if not prefix:
+                    raise
+                logger.warning(f"Répertoire ignoré lors du scan: {directory} ({str(e)})")
+                unreadable.add(prefix)
+        return signatures, unreadable
+
+    @classmethod
+    def scan(cls, root: str, previous: Optional["DirectorySnapshot"] = None,
+             algorithm: Optional[str] = "sha256", workers: Optional[int] = None,
+             ignore: Optional[List[str]] = None) -> "DirectorySnapshot":
+        """
+        Scanne une arborescence en réutilisant les hash d'un snapshot précédent
+        
+        Args:
+            root (str): Racine de l'arborescence
+            previous (DirectorySnapshot, optional): Snapshot précédent (même racine et algorithme)
+            algorithm (str, optional): Algorithme de hachage (None: signatures stat seulement)
+            workers (int, optional): Nombre de threads pour recalculer les hash
+            ignore (list, optional): Motifs fnmatch de noms à ignorer (fichiers et dossiers)
+            
+        Returns:
+            DirectorySnapshot: Nouveau snapshot; les entrées précédentes des sous-dossiers
+                               illisibles sont conservées (voir unreadable)
+            
+        Raises:
+            OSError: Si la racine est absente ou illisible
+        """
+        scanned_ns = time.time_ns()
+        signatures, unreadable = cls._walk(os.path.abspath(root), ignore)
+        files = {}
+        to_hash = []
+        reusable = (previous is not None and previous.algorithm == algorithm
+                    and previous.root == os.path.abspath(root))
+        if unreadable and reusable:
+            # Contenu inconnu: les fichiers connus de ces dossiers ne sont pas supprimés
+            prefixes = tuple(unreadable)
+            for relative, entry in previous.files.items():
+                if relative.startswith(prefixes):
+                    files[relative] = entry
+        # Un fichier modifié juste avant le scan précédent a pu changer depuis
+        # sans que sa date ne bouge: il est revérifié
+        racy_limit = previous.scanned_ns - _HASH_CACHE_RACY_WINDOW_NS if reusable else 0
+        for relative, signature in signatures.items():
+            old = previous.files.get(relative) if reusable else None
+            if (old is not None and old[:3] == signature and signature[1] < racy_limit
+                    and (algorithm is None or old[3] is not None)):
+                files[relative] = old
+            elif algorithm is None:
+                files[relative] = signature + (None,)
+            else:
+                to_hash.append(relative)
+                
+        if to_hash:
+            root_path = os.path.abspath(root)
+            digests = hash_files([os.path.join(root_path, relative) for relative in to_hash],
+                                 algorithm, workers)
+            for relative, digest in zip(to_hash, digests.values()):
+                # Un fichier illisible reste présent (hash None): il n'est pas supprimé
+                files[relative] = signatures[relative] + (digest,)
+        snapshot = cls(root, files, algorithm, scanned_ns)
+        snapshot.unreadable = {prefix.rstrip("/") for prefix in unreadable}
+        return snapshot
+
+    def diff(self, previous: Optional["DirectorySnapshot"]) -> SnapshotDiff:
+        """
+        Compare ce snapshot à un snapshot précédent
+        
+        Avec un algorithme de hachage, un fichier est modifié si son contenu a
+        changé (un simple touch n'est pas signalé); sinon si sa signature a changé.
+        
+        Args:
+            previous (DirectorySnapshot, optional): Snapshot de référence (None: tout est ajouté)
+            
+        Returns:
+            SnapshotDiff: Ensembles added, removed, modified et errors
+        """
+        current = self.files
+        errors = set(self.unreadable)
+        if self.algorithm is not None:
+            errors.update(relative for relative, entry in current.items() if entry[3] is None)
+        if previous is None:
+            return SnapshotDiff(added=current, errors=errors)
+        old = previous.files
+        compare_hash = self.algorithm is not None and self.algorithm == previous.algorithm
+        modified = set()
+        for relative in current.keys() & old.keys():
+            if compare_hash:
+                if relative in errors:
+                    continue
+                # Contenu précédent inconnu (illisible): considéré comme modifié
+                if old[relative][3] is None or current[relative][3] != old[relative][3]:
+                    modified.add(relative)
+            elif current[relative][:3] != old[relative][:3]:
+                modified.add(relative)
+        return SnapshotDiff(added=current.keys() - old.keys(), removed=old.keys() - current.keys(),
+                            modified=modified, errors=errors)
+
+    def save(self, manifest_path: str) -> bool:
+        """
+        Enregistre le snapshot dans un manifeste JSON compact (écriture atomique)
+        
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        content = json.dumps({
+            "version": self.MANIFEST_VERSION,
+            "root": self.root,
+            "algorithm": self.algorithm,
+            "scanned_ns": self.scanned_ns,
+            "files": self.files,
+        }, separators=(",", ":"), ensure_ascii=False)
+        return safe_write_file(manifest_path, content)
+
+    @classmethod
+    def load(cls, manifest_path: str) -> Optional["DirectorySnapshot"]:
+        """
+        Charge un manifeste écrit par save
+        
+        Returns:
+            DirectorySnapshot or None: None si le manifeste est absent, illisible ou d'une autre version
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != cls.MANIFEST_VERSION:
+                return None
+            files = {relative: tuple(entry) for relative, entry in data["files"].items()}
+            return cls(data["root"], files, data["algorithm"], data["scanned_ns"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Manifeste illisible, ignoré: {manifest_path} ({str(e)})")
+            return None
+
+@log_function_call
+def detect_changes(root: str, manifest_path: str, algorithm: Optional[str] = "sha256",
+                   workers: Optional[int] = None, ignore: Optional[List[str]] = None,
+                   save: bool = True) -> SnapshotDiff:
+    """
+    Détecte les fichiers ajoutés, supprimés ou modifiés depuis le dernier appel
+    
+    Charge le manifeste précédent, rescanne l'arborescence (seuls les fichiers
+    dont la signature stat a changé sont relus) puis enregistre le nouveau manifeste.
+    
+    Args:
+        root (str): Racine de l'arborescence
+        manifest_path (str): Manifeste JSON (ignoré lors du scan s'il est dans l'arborescence)
+        algorithm (str, optional): Algorithme de hachage (None: signatures stat seulement)
+        workers (int, optional): Nombre de threads pour recalculer les hash
+        ignore (list, optional): Motifs fnmatch de noms à ignorer
+        save (bool): Si False, le manifeste n'est pas mis à jour
+        
+    Returns:
+        SnapshotDiff: Ensembles added, removed, modified et errors (chemins relatifs à root)
+        
+    Raises:
+        OSError: Si root est absent ou illisible (le manifeste n'est pas modifié)
+    """
+    previous = DirectorySnapshot.load(manifest_path)
+    if previous is not None and previous.root != os.path.abspath(root):
+        previous = None
+    manifest_name = os.path.basename(manifest_path)
+    ignore = list(ignore or ()) + [manifest_name, f"{manifest_name}.bak", f".{manifest_name}.*.tmp"]
+    snapshot = DirectorySnapshot.scan(root, previous, algorithm, workers, ignore)
+    changes = snapshot.diff(previous)
+    if save:
+        snapshot.save(manifest_path)
+    return changes
@@ -3,17 +3,25 @@ Module de gestion des logs pour EndoriumUtils
 """
 
 import os
+import re
 import sys
+import copy
 import logging
 import datetime
 import traceback
 import time
 import functools
-from logging.handlers import RotatingFileHandler
+import itertools
+import reprlib
+import threading
+import queue
+import atexit
+import gzip
+import shutil
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
 from contextlib import contextmanager
 
-# S'assurer que le logging de base est configuré (pour éviter les messages d'avertissement)
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from EndoriumUtils.metrics_utils import record_timing
 
 class ColoredFormatter(logging.Formatter):
     """Formatter qui colore les logs selon le niveau pour la console"""
@@ -31,30 +39,384 @@ class ColoredFormatter(logging.Formatter):
         message = super().format(record)
         return f"{color}{message}{self.RESET}"
 
-def setup_logger(name, log_level=logging.DEBUG, base_dir=None):
-    """Configure et renvoie un logger avec des handlers pour la console et les fichiers
-    
+# Attributs standard d'un LogRecord: tout autre attribut (extra=...) devient un champ JSON
+_STANDARD_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+def _get_json_encoder():
+    """Renvoie une fonction (dict -> str) utilisant orjson si disponible, sinon json"""
+    try:
+        import orjson
+        options = orjson.OPT_NON_STR_KEYS
+
+        def encode(data):
+            return orjson.dumps(data, default=str, option=options).decode("utf-8")
+    except ImportError:
+        import json
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+        encode = encoder.encode
+    return encode
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter produisant une ligne JSON par enregistrement
+
+    Champs: ts, level, logger, message, file, line, func_name, thread, puis
+    exception/stack si présents et tous les attributs passés via extra=
+    (ex: performance, duration_ms, function, section). L'horodatage est
+    formaté une seule fois par seconde; l'encodage utilise orjson si installé.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._encode = _get_json_encoder()
+        # (seconde, préfixe, décalage) remplacé d'un bloc: l'instance est partagée
+        # par plusieurs handlers, chacun sous son propre verrou
+        self._cached = (None, "", "")
+
+    def _timestamp(self, created):
+        second = int(created)
+        cached = self._cached
+        if cached[0] != second:
+            local = time.localtime(second)
+            offset = time.strftime("%z", local)
+            cached = self._cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", local),
+                                     f"{offset[:3]}:{offset[3:]}" if offset else "")
+        return f"{cached[1]}.{int((created - second) * 1000):03d}{cached[2]}"
+
+    def format(self, record):
+        data = {
+            "ts": self._timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "func_name": record.funcName,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and key not in data:
+                data[key] = value
+        return self._encode(data)
+
+# Registre process-wide des loggers configurés et des handlers partagés.
+# Chaque nom n'est configuré qu'une seule fois par get_logger; les handlers de
+# fichiers sont ouverts une seule fois par dossier de logs et partagés par tous
+# les loggers qui écrivent dans ce dossier.
+_registry_lock = threading.RLock()
+_configured_loggers = {}
+_shared_handlers = {}
+_shared_handler_set = set()
+# Incrémenté par clear_logger_registry: les loggers paresseux se résolvent à nouveau
+_registry_generation = 0
+
+# Mode asynchrone (optionnel): paramètres actifs et threads d'écriture par dossier
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_debug")
+_async_settings = None
+_async_listeners = {}
+_atexit_registered = False
+
+class PerformanceFilter(logging.Filter):
+    """Filtre ne laissant passer que les enregistrements de performance"""
+    def filter(self, record):
+        return hasattr(record, 'performance')
+
+# Rotation compressée: paramètres appliqués aux handlers de fichiers partagés
+COMPRESSIONS = ("auto", "gzip", "zstd", None)
+_rotation_settings = {"compression": "auto", "max_total_size": None}
+_compression_queue = None
+_compression_thread = None
+_compression_lock = threading.Lock()
+
+def _get_zstd():
+    """Importe zstandard de manière paresseuse (dépendance optionnelle)"""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+def _resolve_compression(compression):
+    """Renvoie 'gzip', 'zstd' ou None ('auto': zstd si disponible, sinon gzip)"""
+    if compression == "auto":
+        return "zstd" if _get_zstd() is not None else "gzip"
+    if compression == "zstd" and _get_zstd() is None:
+        print("ATTENTION: zstandard non disponible, compression gzip utilisée")
+        return "gzip"
+    return compression
+
+def _compress_segment(path, compression):
+    """Compresse un segment de log (fichier temporaire puis renommage) et supprime l'original"""
+    extension = ".zst" if compression == "zstd" else ".gz"
+    target = path + extension
+    temp = target + ".tmp"
+    try:
+        with open(path, "rb") as source:
+            if compression == "zstd":
+                with open(temp, "wb") as raw:
+                    _get_zstd().ZstdCompressor(level=3).copy_stream(source, raw)
+            else:
+                with open(temp, "wb") as raw, gzip.GzipFile(
+                        filename=os.path.basename(path), mode="wb", compresslevel=6, fileobj=raw) as out:
+                    shutil.copyfileobj(source, out, 1 << 20)
+        os.replace(temp, target)
+        os.remove(path)
+    except FileNotFoundError:
+        # Segment déjà supprimé (budget disque ou purge)
+        pass
+    except Exception as e:
+        print(f"Erreur lors de la compression du log {path}: {str(e)}")
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+def _compression_worker():
+    while True:
+        handler, path = _compression_queue.get()
+        try:
+            if path is not None:
+                _compress_segment(path, handler.compression)
+            handler.enforce_limits()
+        except Exception as e:
+            print(f"Erreur lors de la rotation des logs: {str(e)}")
+        finally:
+            _compression_queue.task_done()
+
+def _submit_rotation_job(handler, path):
+    """Confie un segment au thread de compression (démarré au premier segment)"""
+    global _compression_queue, _compression_thread
+    with _compression_lock:
+        if _compression_thread is None:
+            _compression_queue = queue.Queue()
+            _compression_thread = threading.Thread(target=_compression_worker,
+                                                   name="EndoriumUtils-log-compression", daemon=True)
+            _compression_thread.start()
+    _compression_queue.put((handler, path))
+
+def wait_for_log_compression():
+    """Attend la fin des compressions de segments en attente"""
+    if _compression_queue is not None:
+        _compression_queue.join()
+
+class CompressedRotatingFileHandler(BaseRotatingHandler):
+    """Handler de fichier quotidien, à rotation par taille et segments compressés
+
+    Le fichier courant est `<dossier>/<YYYY-MM-DD><suffixe>.txt`; il change de
+    nom à minuit même dans un processus qui tourne plusieurs jours. Quand il
+    dépasse max_bytes, il est seulement renommé en `.txt.N` (N croissant, le
+    plus grand est le plus récent): la compression gzip/zstd (`.txt.N.gz`),
+    la limite de segments par jour et le budget disque sont appliqués par un
+    thread d'arrière-plan. Le thread qui journalise ne fait qu'un renommage.
+    """
+
+    def __init__(self, folder, suffix="", max_bytes=10 * 1024 * 1024, backup_count=5,
+                 encoding="utf-8", compression="auto", max_total_size=None):
+        """
+        Args:
+            folder (str): Dossier des fichiers de logs
+            suffix (str): Suffixe du nom de fichier après la date (ex: '_debug')
+            max_bytes (int): Taille déclenchant une rotation (0: pas de rotation par taille)
+            backup_count (int): Nombre de segments conservés par jour (0: illimité)
+            encoding (str): Encodage du fichier
+            compression (str): 'auto', 'gzip', 'zstd' ou None (segments non compressés)
+            max_total_size (int, optional): Budget disque en octets pour ce fichier
+                                            (fichier courant et segments, tous jours confondus)
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Compression inconnue: {compression}")
+        self.folder = os.path.abspath(folder)
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compression = _resolve_compression(compression)
+        self.max_total_size = max_total_size
+        self._segment_re = re.compile(
+            r"^(\d{4}-\d{2}-\d{2})" + re.escape(suffix) + r"\.txt\.(\d+)(\.gz|\.zst)?$")
+        self._date = datetime.date.today()
+        self._next_rollover = self._compute_next_rollover()
+        super().__init__(self._path_for(self._date), "a", encoding=encoding, delay=False)
+        self._next_index = self._scan_next_index()
+        # Segments laissés non compressés par un arrêt précédent
+        if self.compression is not None:
+            for name in os.listdir(self.folder):
+                match = self._segment_re.match(name)
+                if match and match.group(3) is None:
+                    _submit_rotation_job(self, os.path.join(self.folder, name))
+
+    def _path_for(self, day):
+        return os.path.join(self.folder, f"{day.isoformat()}{self.suffix}.txt")
+
+    def _compute_next_rollover(self):
+        tomorrow = self._date + datetime.timedelta(days=1)
+        return datetime.datetime.combine(tomorrow, datetime.time.min).timestamp()
+
+    def _scan_next_index(self):
+        day = self._date.isoformat()
+        highest = 0
+        for name in os.listdir(self.folder):
+            match = self._segment_re.match(name)
+            if match and match.group(1) == day:
+                highest = max(highest, int(match.group(2)))
+        return highest + 1
+
+    def shouldRollover(self, record):
+        """Rotation à minuit ou quand le fichier dépasse max_bytes
+
+        Contrairement à RotatingFileHandler, l'enregistrement n'est pas formaté
+        une seconde fois et aucun stat n'est fait: seule la position du flux compte.
+        """
+        if record.created >= self._next_rollover:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self):
+        """Renomme le fichier courant en segment et confie la compression au thread dédié"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        segment = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            segment = f"{self.baseFilename}.{self._next_index}"
+            os.rename(self.baseFilename, segment)
+            self._next_index += 1
+
+        today = datetime.date.today()
+        if today != self._date:
+            self._date = today
+            self._next_rollover = self._compute_next_rollover()
+            self.baseFilename = self._path_for(today)
+            self._next_index = self._scan_next_index()
+        self.stream = self._open()
+
+        if segment is not None and self.compression is not None:
+            _submit_rotation_job(self, segment)
+        elif segment is not None or self.max_total_size is not None:
+            _submit_rotation_job(self, None)
+
+    def _list_segments(self):
+        """Renvoie les segments de ce fichier: [(date, index, chemin, taille)], du plus ancien au plus récent"""
+        segments = []
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                match = self._segment_re.match(entry.name)
+                if match is None:
+                    continue
+                if match.group(3) is None and self.compression is not None:
+                    # En attente de compression: sa version compressée le remplacera
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except FileNotFoundError:
+                    continue
+                segments.append((match.group(1), int(match.group(2)), entry.path, size))
+        segments.sort()
+        return segments
+
+    def enforce_limits(self):
+        """Applique backup_count (par jour) et max_total_size (appelé par le thread de compression)"""
+        if not self.backup_count and self.max_total_size is None:
+            return
+        segments = self._list_segments()
+        removed = set()
+        if self.backup_count:
+            per_day = {}
+            for segment in segments:
+                per_day.setdefault(segment[0], []).append(segment)
+            for day_segments in per_day.values():
+                for segment in day_segments[:-self.backup_count]:
+                    removed.add(segment[2])
+        if self.max_total_size is not None:
+            try:
+                total = os.path.getsize(self.baseFilename)
+            except OSError:
+                total = 0
+            remaining = [segment for segment in segments if segment[2] not in removed]
+            total += sum(segment[3] for segment in remaining)
+            for segment in remaining:
+                if total <= self.max_total_size:
+                    break
+                removed.add(segment[2])
+                total -= segment[3]
+        for path in removed:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def _default_base_dir():
+    """Détermine le répertoire de base des logs selon le contexte d'exécution"""
+    if getattr(sys, 'frozen', False):
+        # Si on est dans un exécutable (PyInstaller)
+        return os.path.dirname(sys.executable)
+    # En développement
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _register_shared(key, handler):
+    """Enregistre un handler partagé dans le registre"""
+    _shared_handlers[key] = handler
+    _shared_handler_set.add(handler)
+    return handler
+
+def _get_console_handler():
+    """Renvoie le handler console partagé, créé au premier appel"""
+    handler = _shared_handlers.get("console")
+    if handler is None:
+        console_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(ColoredFormatter(console_format))
+        _register_shared("console", handler)
+    return handler
+
+# Formats des fichiers de logs: texte détaillé ou JSON-lines
+LOG_FORMATS = ("text", "json")
+_FILE_FORMAT = "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
+_PERF_FORMAT = "%(asctime)s [PERF] %(name)s: %(message)s"
+
+def _make_file_formatters(log_format):
+    """Renvoie les formatters (général, performance) pour un format de fichier"""
+    if log_format == "json":
+        formatter = JsonLinesFormatter()
+        return formatter, formatter
+    return logging.Formatter(_FILE_FORMAT), logging.Formatter(_PERF_FORMAT)
+
+def _set_file_format(key, log_format):
+    """Applique un format à tous les handlers de fichiers partagés d'un dossier"""
+    file_formatter, perf_formatter = _make_file_formatters(log_format)
+    for handler in _shared_handlers[key]:
+        if any(isinstance(f, PerformanceFilter) for f in handler.filters):
+            handler.setFormatter(perf_formatter)
+        else:
+            handler.setFormatter(file_formatter)
+
+def _get_file_handlers(base_dir):
+    """Crée au besoin les handlers de fichiers partagés pour un répertoire de base
+
+    Les fichiers ne sont ouverts qu'une seule fois par dossier; les appels
+    suivants réutilisent les mêmes handlers, qui changent eux-mêmes de fichier
+    à minuit et compressent leurs segments en arrière-plan.
+
     Args:
-        name (str): Nom du logger (généralement __name__ du module)
-        log_level (int): Niveau de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        base_dir (str, optional): Répertoire de base pour les logs. Si None, utilise le répertoire 
-                                 du projet ou de l'exécutable.
-        
+        base_dir (str): Répertoire de base pour les logs
+
     Returns:
-        logging.Logger: Logger configuré
+        tuple: Clé du registre sous laquelle les handlers (général, debug,
+               erreur, performance) sont enregistrés
     """
-    # Déterminer le répertoire de base en fonction du contexte d'exécution
-    if base_dir is None:
-        if getattr(sys, 'frozen', False):
-            # Si on est dans un exécutable (PyInstaller)
-            base_dir = os.path.dirname(sys.executable)
-        else:
-            # En développement
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Création des répertoires de logs
-    log_date = datetime.datetime.now().strftime("%Y-%m-%d")
     log_folder = os.path.join(base_dir, "logs")
+    key = ("files", os.path.abspath(log_folder))
+    if key in _shared_handlers:
+        return key
+
     debug_folder = os.path.join(log_folder, "debug")
     error_folder = os.path.join(log_folder, "error")
     perf_folder = os.path.join(log_folder, "performance")
@@ -65,128 +427,358 @@ def setup_logger(name, log_level=logging.DEBUG, base_dir=None):
             os.makedirs(folder)
             print(f"Dossier de logs créé: {folder}")
     
-    # Chemins des fichiers de logs
-    log_file_path = os.path.join(log_folder, f"{log_date}.txt")
-    debug_file_path = os.path.join(debug_folder, f"{log_date}_debug.txt")
-    error_file_path = os.path.join(error_folder, f"{log_date}_error.txt")
-    perf_file_path = os.path.join(perf_folder, f"{log_date}_performance.txt")
-    
-    print(f"Configuration des logs dans: {log_file_path}")
-    
-    # Création du logger
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    logger.propagate = False
-    
-    # Si ce logger a déjà des handlers, on les supprime pour éviter les duplications
-    if logger.handlers:
-        logger.handlers.clear()
-    
-    # Formats détaillés pour les logs
-    console_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    file_format = "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
-    perf_format = "%(asctime)s [PERF] %(name)s: %(message)s"
+    file_formatter, perf_formatter = _make_file_formatters("text")
     
-    # Configuration du formatter
-    console_formatter = ColoredFormatter(console_format)
-    file_formatter = logging.Formatter(file_format)
-    perf_formatter = logging.Formatter(perf_format)
+    compression = _rotation_settings["compression"]
+    max_total_size = _rotation_settings["max_total_size"]
+    handlers = []
     
-    # Handler pour la console (stdout)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
-    # Handler pour le fichier de log général (avec rotation par taille)
+    # Handler pour le fichier de log général (rotation quotidienne et par taille).
+    # Pas de niveau propre: c'est le niveau de chaque logger qui filtre.
     try:
-        file_handler = RotatingFileHandler(
-            log_file_path, 
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8"
+        file_handler = CompressedRotatingFileHandler(
+            log_folder, "",
+            max_bytes=10*1024*1024,  # 10MB
+            backup_count=5,
+            compression=compression,
+            max_total_size=max_total_size
         )
-        file_handler.setLevel(log_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-        print(f"Handler de fichier ajouté: {log_file_path}")
+        handlers.append(file_handler)
+        print(f"Configuration des logs dans: {file_handler.baseFilename}")
+        print(f"Handler de fichier ajouté: {file_handler.baseFilename}")
     except Exception as e:
         print(f"Erreur lors de la création du handler de fichier: {str(e)}")
     
     # Handler pour les logs de debug (DEBUG et au-dessus)
     try:
-        debug_handler = RotatingFileHandler(
-            debug_file_path,
-            maxBytes=20*1024*1024,  # 20MB
-            backupCount=3,
-            encoding="utf-8"
+        debug_handler = CompressedRotatingFileHandler(
+            debug_folder, "_debug",
+            max_bytes=20*1024*1024,  # 20MB
+            backup_count=3,
+            compression=compression,
+            max_total_size=max_total_size
         )
         debug_handler.setLevel(logging.DEBUG)
         debug_handler.setFormatter(file_formatter)
-        logger.addHandler(debug_handler)
+        handlers.append(debug_handler)
     except Exception as e:
         print(f"Erreur lors de la création du handler de debug: {str(e)}")
     
     # Handler pour les erreurs (ERROR et CRITICAL)
     try:
-        error_handler = RotatingFileHandler(
-            error_file_path,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=10,
-            encoding="utf-8"
+        error_handler = CompressedRotatingFileHandler(
+            error_folder, "_error",
+            max_bytes=10*1024*1024,  # 10MB
+            backup_count=10,
+            compression=compression,
+            max_total_size=max_total_size
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
     except Exception as e:
         print(f"Erreur lors de la création du handler d'erreur: {str(e)}")
     
     # Handler pour les performances
     try:
-        perf_handler = RotatingFileHandler(
-            perf_file_path,
-            maxBytes=5*1024*1024,  # 5MB
-            backupCount=3,
-            encoding="utf-8"
+        perf_handler = CompressedRotatingFileHandler(
+            perf_folder, "_performance",
+            max_bytes=5*1024*1024,  # 5MB
+            backup_count=3,
+            compression=compression,
+            max_total_size=max_total_size
         )
-        # Créer un filtre personnalisé pour les logs de performances
-        class PerformanceFilter(logging.Filter):
-            def filter(self, record):
-                return hasattr(record, 'performance')
-        
         perf_handler.addFilter(PerformanceFilter())
         perf_handler.setFormatter(perf_formatter)
-        logger.addHandler(perf_handler)
+        handlers.append(perf_handler)
     except Exception as e:
         print(f"Erreur lors de la création du handler de performance: {str(e)}")
     
-    # Vérifier que le logger a bien des handlers
-    if not logger.handlers:
-        print("ATTENTION: Le logger n'a pas de handlers!")
+    for handler in handlers:
+        _shared_handler_set.add(handler)
+    _shared_handlers[key] = handlers
+    return key
+
+def configure_log_rotation(compression="auto", max_total_size=None):
+    """Règle la compression des segments et le budget disque des fichiers de logs
+
+    S'applique aux handlers de fichiers partagés existants et futurs.
+
+    Args:
+        compression (str): 'auto' (zstd si zstandard est installé, sinon gzip),
+                           'gzip', 'zstd' ou None (segments non compressés)
+        max_total_size (int, optional): Budget disque en octets par type de fichier
+                                        (général, debug, erreur, performance)
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Compression inconnue: {compression}")
+    resolved = _resolve_compression(compression)
+    with _registry_lock:
+        _rotation_settings["compression"] = compression
+        _rotation_settings["max_total_size"] = max_total_size
+        for handler in _shared_handler_set:
+            if isinstance(handler, CompressedRotatingFileHandler):
+                handler.acquire()
+                try:
+                    handler.compression = resolved
+                    handler.max_total_size = max_total_size
+                finally:
+                    handler.release()
+                _submit_rotation_job(handler, None)
+
+class _LogQueue(queue.Queue):
+    """File bornée appliquant une politique de débordement pour le mode asynchrone
+
+    Politiques:
+        - "block": l'appelant attend qu'une place se libère
+        - "drop_oldest": l'enregistrement le plus ancien est abandonné
+        - "drop_debug": les enregistrements DEBUG sont abandonnés en premier
+          (le nouveau s'il est DEBUG, sinon le plus ancien DEBUG en file),
+          puis le plus ancien
+    """
+    def __init__(self, maxsize, overflow_policy="block"):
+        super().__init__(maxsize)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+
+    def put(self, item, block=True, timeout=None):
+        # La sentinelle d'arrêt (None) attend toujours une place libre
+        if item is None or self.overflow_policy == "block":
+            return super().put(item, True, None)
+        with self.not_full:
+            if self.maxsize > 0 and self._qsize() >= self.maxsize:
+                if not self._make_room(item):
+                    self.dropped += 1
+                    return
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _make_room(self, item):
+        """Libère une place selon la politique; False si item doit être abandonné"""
+        victim = None
+        if self.overflow_policy == "drop_debug":
+            if item.levelno <= logging.DEBUG:
+                return False
+            for index, queued in enumerate(self.queue):
+                if queued is not None and queued.levelno <= logging.DEBUG:
+                    victim = index
+                    break
+        if victim is None:
+            if self.queue[0] is None:
+                return False
+            victim = 0
+        del self.queue[victim]
+        self.unfinished_tasks -= 1
+        self.dropped += 1
+        return True
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler qui transmet l'exception déjà formatée au thread d'écriture
+
+    QueueHandler.prepare efface exc_info et exc_text après avoir ajouté la
+    trace au message: les fichiers JSON perdaient leur champ "exception".
+    Ici le message reste le message seul et la trace voyage dans exc_text,
+    que les formatters texte et JSON utilisent tous deux.
+    """
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        # Arguments évalués dans le thread appelant (ils peuvent changer ensuite)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            # Les objets traceback ne doivent pas survivre dans la file
+            record.exc_info = None
+        return record
+
+def _get_async_handler(key, handlers):
+    """Renvoie le QueueHandler partagé d'un dossier de logs, démarre son thread d'écriture"""
+    async_key = ("async",) + key
+    queue_handler = _shared_handlers.get(async_key)
+    if queue_handler is None:
+        log_queue = _LogQueue(_async_settings["queue_size"], _async_settings["overflow_policy"])
+        queue_handler = _RecordQueueHandler(log_queue)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _async_listeners[async_key] = listener
+        _register_shared(async_key, queue_handler)
+    return queue_handler
+
+def _pop_async_listeners():
+    """Retire du registre les QueueHandler actifs et renvoie leurs threads d'écriture"""
+    listeners = list(_async_listeners.values())
+    for async_key in _async_listeners:
+        _shared_handler_set.discard(_shared_handlers.pop(async_key, None))
+    _async_listeners.clear()
+    return listeners
+
+def _stop_listeners(listeners):
+    """Arrête des threads d'écriture après avoir vidé leurs files"""
+    for listener in listeners:
+        try:
+            listener.stop()
+        except Exception as e:
+            print(f"Erreur lors de l'arrêt du thread de logs: {str(e)}")
+
+def _stop_async_listeners():
+    """Vide et arrête tous les threads d'écriture (appelé aussi à la sortie du processus)"""
+    with _registry_lock:
+        _stop_listeners(_pop_async_listeners())
+
+def _attach_handlers(logger, key):
+    """Remplace les handlers partagés d'un logger par ceux du dossier indiqué"""
+    handlers = [_get_console_handler()] + list(_shared_handlers[key])
+    if _async_settings is not None:
+        handlers = [_get_async_handler(key, handlers)]
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for handler in handlers:
+        logger.addHandler(handler)
+    logger._endorium_handlers_key = key
+    return handlers
+
+def setup_logger(name, log_level=logging.DEBUG, base_dir=None, log_format=None):
+    """Configure et renvoie un logger avec des handlers pour la console et les fichiers
+
+    Appeler cette fonction reconfigure explicitement le logger, même s'il est
+    déjà présent dans le registre. Les handlers de fichiers sont partagés entre
+    tous les loggers utilisant le même répertoire de base.
     
+    Args:
+        name (str): Nom du logger (généralement __name__ du module)
+        log_level (int): Niveau de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        base_dir (str, optional): Répertoire de base pour les logs. Si None, utilise le répertoire 
+                                 du projet ou de l'exécutable.
+        log_format (str, optional): Format des fichiers de logs: 'text' ou 'json' (une ligne
+                                    JSON par enregistrement). S'applique à tous les loggers du
+                                    même répertoire de base; None conserve le format actuel.
+        
+    Returns:
+        logging.Logger: Logger configuré
+    """
+    if log_format is not None and log_format not in LOG_FORMATS:
+        raise ValueError(f"Format de log inconnu: {log_format}")
+    if base_dir is None:
+        base_dir = _default_base_dir()
+    
+    with _registry_lock:
+        key = _get_file_handlers(base_dir)
+        if log_format is not None:
+            _set_file_format(key, log_format)
+        
+        # Création du logger
+        logger = logging.getLogger(name)
+        logger.setLevel(log_level)
+        logger.propagate = False
+        
+        # Si ce logger a déjà des handlers, on les retire pour éviter les duplications
+        _attach_handlers(logger, key)
+        
+        # Vérifier que le logger a bien des handlers de fichiers
+        if not _shared_handlers[key]:
+            print("ATTENTION: Le logger n'a pas de handlers de fichiers!")
+        
+        _configured_loggers[name] = logger
     return logger
 
-# Configurer le logger principal - avec gestion d'erreurs pour débogage
-try:
-    print("Initialisation du système de logs EndoriumUtils...")
-    logger = setup_logger("EndoriumUtils")
-    logger.info("Système de logs EndoriumUtils initialisé avec succès")
-except Exception as e:
-    print(f"ERREUR lors de l'initialisation du système de logs EndoriumUtils: {str(e)}")
-    traceback.print_exc()
-    # Fallback logger
-    logger = logging.getLogger("EndoriumUtils")
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-    logger.addHandler(handler)
-    logger.setLevel(logging.DEBUG)
-    logger.propagate = False
-    logger.error(f"Échec de l'initialisation du système de logs complet: {str(e)}")
+def clear_logger_registry():
+    """Vide le registre des loggers et ferme les handlers de fichiers partagés
+
+    Les loggers déjà obtenus perdent leurs handlers partagés; le prochain appel à
+    get_logger ou setup_logger les reconfigure et rouvre les fichiers. Les loggers
+    paresseux (get_lazy_logger) le font d'eux-mêmes au prochain usage.
+    """
+    global _registry_generation
+    with _registry_lock:
+        _registry_generation += 1
+        for logger in _configured_loggers.values():
+            for handler in list(logger.handlers):
+                if handler in _shared_handler_set:
+                    logger.removeHandler(handler)
+        _stop_async_listeners()
+        for handler in _shared_handler_set:
+            try:
+                handler.close()
+            except Exception as e:
+                print(f"Erreur lors de la fermeture du handler {handler}: {str(e)}")
+        _configured_loggers.clear()
+        _shared_handlers.clear()
+        _shared_handler_set.clear()
+
+def enable_async_logging(queue_size=10000, overflow_policy="block"):
+    """Active l'écriture asynchrone des logs pour tous les loggers du registre
+
+    Les appelants déposent les enregistrements dans une file bornée en mémoire;
+    un thread d'écriture par dossier de logs possède la console et les fichiers
+    rotatifs. Les threads appelants ne bloquent donc plus sur les écritures
+    disque ni sur les renommages de rotation. Les files sont vidées
+    proprement à la fin du processus.
+
+    Args:
+        queue_size (int): Nombre maximal d'enregistrements en attente
+        overflow_policy (str): Politique quand la file est pleine:
+                               'block', 'drop_oldest' ou 'drop_debug'
+    """
+    global _async_settings, _atexit_registered
+    if overflow_policy not in OVERFLOW_POLICIES:
+        raise ValueError(f"Politique de débordement inconnue: {overflow_policy}")
+    with _registry_lock:
+        previous = _pop_async_listeners()
+        _async_settings = {"queue_size": queue_size, "overflow_policy": overflow_policy}
+        if not _atexit_registered:
+            atexit.register(_stop_async_listeners)
+            _atexit_registered = True
+        for logger in _configured_loggers.values():
+            _attach_handlers(logger, logger._endorium_handlers_key)
+        # Les anciennes files ne reçoivent plus rien: on peut les vider
+        _stop_listeners(previous)
+
+def disable_async_logging():
+    """Vide les files en attente et repasse tous les loggers en écriture synchrone"""
+    global _async_settings
+    with _registry_lock:
+        previous = _pop_async_listeners()
+        _async_settings = None
+        for logger in _configured_loggers.values():
+            _attach_handlers(logger, logger._endorium_handlers_key)
+        _stop_listeners(previous)
+
+def get_async_logging_stats():
+    """Renvoie l'état des files du mode asynchrone
+
+    Returns:
+        dict: 'enabled', 'queued' (enregistrements en attente) et
+              'dropped' (enregistrements abandonnés par la politique de débordement)
+    """
+    with _registry_lock:
+        queues = [listener.queue for listener in _async_listeners.values()]
+        return {
+            "enabled": _async_settings is not None,
+            "queued": sum(q.qsize() for q in queues),
+            "dropped": sum(q.dropped for q in queues),
+        }
 
 def get_logger(name):
-    """Renvoie un logger configuré pour un module spécifique"""
+    """Renvoie un logger configuré pour un module spécifique
+
+    Le logger est configuré au premier appel puis conservé dans le registre:
+    les appels suivants ne coûtent qu'une recherche dans un dictionnaire.
+    Utiliser setup_logger pour le reconfigurer explicitement.
+    """
+    logger = _configured_loggers.get(name)
+    if logger is not None:
+        return logger
     try:
-        return setup_logger(name)
+        with _registry_lock:
+            logger = _configured_loggers.get(name)
+            if logger is None:
+                logger = setup_logger(name)
+            return logger
     except Exception as e:
         print(f"Erreur lors de la création du logger pour {name}: {str(e)}")
         fallback = logging.getLogger(name)
@@ -198,92 +790,237 @@ def get_logger(name):
             fallback.propagate = False
         return fallback
 
-def log_function_call(func):
-    """Décorateur pour logger l'appel et le retour des fonctions"""
+# Rendu borné des arguments et des résultats pour les logs de debug:
+# les conteneurs volumineux sont tronqués pendant le rendu, pas après.
+_MAX_STR_LENGTH = 500
+_value_repr = reprlib.Repr()
+_value_repr.maxlevel = 3
+_value_repr.maxdict = 10
+_value_repr.maxlist = 10
+_value_repr.maxtuple = 10
+_value_repr.maxset = 10
+_value_repr.maxstring = 100
+_value_repr.maxother = 100
+
+def _render_value(value):
+    """Renvoie une représentation de taille bornée d'une valeur"""
+    try:
+        if isinstance(value, str):
+            if len(value) > _MAX_STR_LENGTH:
+                return f"{value[:50]}... [tronqué]"
+            return value
+        return _value_repr.repr(value)
+    except Exception:
+        return f"<{type(value).__name__} non affichable>"
+
+_MAX_SECRET_SCAN_DEPTH = 20
+
+def _is_sensitive_text(text):
+    """Indique si un texte contient un mot-clé sensible"""
+    lowered = text.lower()
+    return 'password' in lowered or 'token' in lowered
+
+_SCALAR_TYPES = (bool, int, float, type(None))
+
+def _contains_secret(value, depth=0, seen=None):
+    """Recherche un mot-clé sensible dans la valeur complète, non tronquée
+
+    Les conteneurs usuels sont parcourus clé par clé et élément par élément,
+    sans construire leur représentation; les autres objets sont testés via
+    str() comme avant le rendu borné.
+    """
+    if isinstance(value, str):
+        return _is_sensitive_text(value)
+    if isinstance(value, _SCALAR_TYPES):
+        return False
+    if depth < _MAX_SECRET_SCAN_DEPTH and isinstance(value, (dict, list, tuple, set, frozenset)):
+        # Chaque conteneur n'est visité qu'une fois (références partagées ou cycles)
+        if seen is None:
+            seen = set()
+        elif id(value) in seen:
+            return False
+        seen.add(id(value))
+        if isinstance(value, dict):
+            for k, v in value.items():
+                if _contains_secret(k, depth + 1, seen) or _contains_secret(v, depth + 1, seen):
+                    return True
+            return False
+        for item in value:
+            # Les scalaires, majoritaires, sont écartés sans appel récursif
+            if not isinstance(item, _SCALAR_TYPES) and _contains_secret(item, depth + 1, seen):
+                return True
+        return False
+    try:
+        return _is_sensitive_text(str(value))
+    except Exception:
+        return False
+
+def _render_arg(value):
+    """Rendu borné d'un argument, masqué s'il semble contenir un secret
+
+    Le mot-clé est recherché dans la valeur complète: une troncature ne doit
+    pas couper le mot-clé et laisser passer le secret qui le suit.
+    """
+    rendered = _render_value(value)
+    if _is_sensitive_text(rendered):
+        return "***SENSIBLE***"
+    # Une chaîne courte est rendue telle quelle: inutile de la rescanner
+    if (not isinstance(value, str) or len(value) > _MAX_STR_LENGTH) and _contains_secret(value):
+        return "***SENSIBLE***"
+    return rendered
+
+def _render_call(args, kwargs):
+    """Rendu des arguments positionnels et nommés d'un appel"""
+    parts = [_render_arg(arg) for arg in args]
+    for k, v in kwargs.items():
+        # Filtrer des arguments nommés sensibles
+        if _is_sensitive_text(k):
+            parts.append(f"{k}=***SENSIBLE***")
+        else:
+            parts.append(f"{k}={_render_value(v)}")
+    return ", ".join(parts)
+
+class _LazyLogger:
+    """Logger résolu par get_logger au premier usage
+
+    Permet aux modules de déclarer leur logger à l'import sans créer de
+    dossiers ni ouvrir de fichiers tant que rien n'est journalisé.
+    """
+    __slots__ = ("name", "_logger", "_generation")
+
+    def __init__(self, name):
+        self.name = name
+        self._logger = None
+        self._generation = None
+
+    def __getattr__(self, attr):
+        logger = self._logger
+        if logger is None or self._generation != _registry_generation:
+            # Premier usage, ou registre vidé depuis (clear_logger_registry)
+            self._generation = _registry_generation
+            logger = self._logger = get_logger(self.name)
+        return getattr(logger, attr)
+
+    def __repr__(self):
+        return f"<_LazyLogger {self.name}>"
+
+def get_lazy_logger(name):
+    """Renvoie un logger configuré paresseusement pour un module spécifique
+
+    Args:
+        name (str): Nom du logger
+
+    Returns:
+        _LazyLogger: Proxy qui appelle get_logger(name) au premier usage
+    """
+    return _LazyLogger(name)
+
+def __getattr__(name):
+    # Logger principal du package, configuré au premier accès (PEP 562)
+    if name == "logger":
+        return get_logger("EndoriumUtils")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def log_function_call(func=None, *, sample_rate=1):
+    """Décorateur pour logger l'appel et le retour des fonctions
+
+    Les arguments et le résultat ne sont rendus (avec une taille bornée) que si
+    le niveau DEBUG est actif pour le logger du module. Les exceptions et les
+    appels lents (> 0.1 s) sont toujours journalisés.
+
+    S'utilise sans argument (@log_function_call) ou avec un échantillonnage
+    (@log_function_call(sample_rate=100) trace 1 appel sur 100).
+
+    Args:
+        func (callable): Fonction à décorer
+        sample_rate (int): Trace un appel sur sample_rate en DEBUG
+    """
+    if func is None:
+        return functools.partial(log_function_call, sample_rate=sample_rate)
+    if sample_rate < 1:
+        raise ValueError(f"sample_rate doit être >= 1: {sample_rate}")
+
+    func_name = func.__name__
+    module_name = func.__module__
+    metric_name = f"{module_name}.{func.__qualname__}"
+    call_counter = itertools.count()
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = func.__name__
-        module_name = func.__module__
         func_logger = get_logger(module_name)
         
-        # Filtrer des arguments sensibles si nécessaire (ex: mots de passe)
-        safe_args = []
-        for arg in args:
-            if isinstance(arg, str) and len(arg) > 500:
-                safe_args.append(f"{arg[:50]}... [tronqué]")
-            elif 'password' in str(arg).lower() or 'token' in str(arg).lower():
-                safe_args.append("***SENSIBLE***")
-            else:
-                safe_args.append(str(arg))
-        
-        # Filtrer des arguments nommés sensibles
-        safe_kwargs = {}
-        for k, v in kwargs.items():
-            if 'password' in k.lower() or 'token' in k.lower():
-                safe_kwargs[k] = "***SENSIBLE***"
-            elif isinstance(v, str) and len(v) > 500:
-                safe_kwargs[k] = f"{v[:50]}... [tronqué]"
-            else:
-                safe_kwargs[k] = v
-                
-        # Log des arguments
-        args_str = ", ".join(safe_args)
-        kwargs_str = ", ".join(f"{k}={v}" for k, v in safe_kwargs.items())
-        all_args = ", ".join(filter(None, [args_str, kwargs_str]))
-        
-        func_logger.debug(f"APPEL {func_name}({all_args})")
+        # Ne rien rendre si aucun log de debug ne serait émis
+        trace = func_logger.isEnabledFor(logging.DEBUG)
+        if trace and sample_rate > 1:
+            trace = next(call_counter) % sample_rate == 0
+        if trace:
+            func_logger.debug("APPEL %s(%s)", func_name, _render_call(args, kwargs))
         
         # Mesurer le temps d'exécution
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            # Si le résultat est très volumineux, ne pas le logger complètement
-            str_result = str(result)
-            if len(str_result) > 500:
-                str_result = str_result[:100] + "... [tronqué]"
-            
-            # Calculer le temps d'exécution
-            exec_time = time.time() - start_time
-            
-            # Log normal du résultat
-            func_logger.debug(f"RETOUR {func_name}: {str_result}")
-            
-            # Log de performance si l'exécution a pris plus de 0.1 seconde
-            if exec_time > 0.1:
-                # Créer un log spécial avec attribut performance
-                record = func_logger.makeRecord(
-                    module_name, 
-                    logging.INFO, 
-                    func.__code__.co_filename, 
-                    func.__code__.co_firstlineno,
-                    f"Fonction {func_name} exécutée en {exec_time:.2f} secondes",
-                    (), None
-                )
-                setattr(record, 'performance', True)
-                for handler in func_logger.handlers:
-                    handler.handle(record)
-            
-            return result
         except Exception as e:
             # Log d'erreur détaillé
-            exec_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_time
+            record_timing(metric_name, elapsed_ns, error=True)
+            exec_time = elapsed_ns / 1e9
             func_logger.error(
                 f"EXCEPTION dans {func_name} après {exec_time:.2f}s: "
-                f"{type(e).__name__}: {str(e)}"
+                f"{type(e).__name__}: {str(e)}",
+                extra={"function": metric_name, "duration_ms": round(elapsed_ns / 1e6, 3)}
             )
             func_logger.error(traceback.format_exc())
             raise
+        
+        # Calculer le temps d'exécution
+        elapsed_ns = time.perf_counter_ns() - start_time
+        record_timing(metric_name, elapsed_ns)
+        exec_time = elapsed_ns / 1e9
+        
+        # Log normal du résultat (tronqué s'il est volumineux)
+        if trace:
+            func_logger.debug("RETOUR %s: %s", func_name, _render_value(result))
+        
+        # Log de performance si l'exécution a pris plus de 0.1 seconde
+        if exec_time > 0.1:
+            # Créer un log spécial avec attribut performance
+            record = func_logger.makeRecord(
+                module_name, 
+                logging.INFO, 
+                func.__code__.co_filename, 
+                func.__code__.co_firstlineno,
+                f"Fonction {func_name} exécutée en {exec_time:.2f} secondes",
+                (), None
+            )
+            setattr(record, 'performance', True)
+            record.function = metric_name
+            record.duration_ms = round(elapsed_ns / 1e6, 3)
+            for handler in func_logger.handlers:
+                handler.handle(record)
+        
+        return result
     return wrapper
 
 @contextmanager
 def log_performance(logger, section_name):
-    """Context manager pour mesurer et logger le temps d'exécution d'une section de code"""
-    start_time = time.time()
+    """Context manager pour mesurer et logger le temps d'exécution d'une section de code
+
+    La durée est aussi agrégée sous section_name dans le registre de métriques
+    (voir EndoriumUtils.metrics_utils.get_metrics_snapshot).
+    """
+    start_time = time.perf_counter_ns()
+    error = False
     try:
         yield
+    except BaseException:
+        error = True
+        raise
     finally:
-        execution_time = time.time() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_time
+        record_timing(section_name, elapsed_ns, error)
+        execution_time = elapsed_ns / 1e9
         # Créer un log spécial avec attribut performance
         record = logger.makeRecord(
             logger.name, 
@@ -294,58 +1031,205 @@ def log_performance(logger, section_name):
             (), None
         )
         setattr(record, 'performance', True)
+        record.section = section_name
+        record.duration_ms = round(elapsed_ns / 1e6, 3)
+        record.error = error
         for handler in logger.handlers:
             handler.handle(record)
 
-def purge_old_logs(days=30, base_dir=None):
-    """Supprime les fichiers de logs plus anciens que le nombre de jours spécifié"""
+# Fichiers de logs: "YYYY-MM-DD.txt" ou "YYYY-MM-DD_<type>.txt", et leurs
+# segments de rotation ".txt.1" à ".txt.N", compressés ou non (.gz, .zst)
+_LOG_FILE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:_[^/\\]*)?\.txt(?:\.\d+(?:\.gz|\.zst)?)?$")
+_ROTATED_TXT_RE = re.compile(r"\.txt(?:\.\d+(?:\.gz|\.zst)?)?$")
+
+# Purge périodique en arrière-plan
+_purge_thread = None
+_purge_stop = None
+
+def _scan_log_files(log_folder):
+    """Parcourt le dossier de logs en une seule passe os.scandir récursive
+
+    Returns:
+        list: Entrées (DirEntry, date "YYYY-MM-DD" lue dans le nom ou None)
+    """
+    found = []
+    stack = [log_folder]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                match = _LOG_FILE_RE.match(entry.name)
+                if match:
+                    found.append((entry, match.group(1)))
+                elif _ROTATED_TXT_RE.search(entry.name):
+                    found.append((entry, None))
+    return found
+
+def _select_purge(files, days, max_total_size, open_files):
+    """Sélectionne les fichiers à supprimer (âge puis taille totale)
+
+    Un fichier daté d'un jour postérieur à la date limite ne peut pas être plus
+    ancien qu'elle: il est conservé sans appel à stat (les dates ISO se comparent
+    comme des chaînes). Les fichiers ouverts par les handlers partagés ne sont
+    jamais supprimés.
+
+    Returns:
+        list: Tuples (chemin, taille) à supprimer, les plus anciens d'abord
+    """
+    cutoff = time.time() - days * 86400 if days is not None else None
+    cutoff_day = datetime.date.fromtimestamp(cutoff).isoformat() if cutoff is not None else None
+    to_delete = []
+    kept = []
+    for entry, day in files:
+        is_open = entry.path in open_files
+        if is_open and max_total_size is None:
+            continue
+        if (cutoff is not None and (day is None or day <= cutoff_day)) or max_total_size is not None:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            if is_open:
+                # Compté dans la taille totale mais jamais supprimé
+                kept.append((float("inf"), entry.path, st.st_size, False))
+            elif cutoff is not None and st.st_mtime < cutoff:
+                to_delete.append((st.st_mtime, entry.path, st.st_size))
+            elif max_total_size is not None:
+                kept.append((st.st_mtime, entry.path, st.st_size, True))
+                
+    to_delete.sort()
+    if max_total_size is not None:
+        total = sum(size for _, _, size, _ in kept)
+        kept.sort()
+        for mtime, path, size, removable in kept:
+            if total <= max_total_size:
+                break
+            if removable:
+                to_delete.append((mtime, path, size))
+                total -= size
+    return [(path, size) for _, path, size in to_delete]
+
+def purge_old_logs(days=30, base_dir=None, max_total_size=None, dry_run=False):
+    """Supprime les fichiers de logs plus anciens que le nombre de jours spécifié
+
+    Le dossier est parcouru en une seule passe os.scandir; la date est lue dans le
+    nom des fichiers (YYYY-MM-DD[_type].txt, segments .txt.N[.gz|.zst] inclus) pour éviter
+    les appels à stat sur les fichiers récents. Les fichiers en cours d'écriture
+    sont conservés. Une seule ligne de résumé est journalisée.
+
+    Args:
+        days (int, optional): Âge maximal en jours (None: pas de limite d'âge)
+        base_dir (str, optional): Répertoire de base des logs
+        max_total_size (int, optional): Taille totale maximale du dossier en octets;
+                                        les plus anciens fichiers sont supprimés au-delà
+        dry_run (bool): Si True, ne supprime rien et renvoie le nombre de fichiers concernés
+
+    Returns:
+        int: Nombre de fichiers supprimés (ou qui le seraient en dry_run)
+    """
     logger = get_logger("EndoriumUtils.log_management")
-    logger.info(f"Purge des logs plus anciens que {days} jours")
     
     try:
-        # Déterminer le répertoire de base en fonction du contexte d'exécution
         if base_dir is None:
-            if getattr(sys, 'frozen', False):
-                # Si on est dans un exécutable (PyInstaller)
-                base_dir = os.path.dirname(sys.executable)
-            else:
-                # En développement
-                base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            base_dir = _default_base_dir()
                 
-        log_folder = os.path.join(base_dir, "logs")
+        log_folder = os.path.abspath(os.path.join(base_dir, "logs"))
         if not os.path.exists(log_folder):
             logger.warning(f"Dossier de logs introuvable: {log_folder}")
             return 0
             
-        now = time.time()
-        count = 0
-        
-        for root, _, files in os.walk(log_folder):
-            for file in files:
-                if file.endswith(".txt"):
-                    file_path = os.path.join(root, file)
-                    if os.stat(file_path).st_mtime < now - days * 86400:
-                        os.remove(file_path)
-                        count += 1
-                        logger.debug(f"Suppression de l'ancien log: {file_path}")
+        with _registry_lock:
+            open_files = {os.path.abspath(h.baseFilename) for h in _shared_handler_set
+                          if getattr(h, "baseFilename", None)}
+        selected = _select_purge(_scan_log_files(log_folder), days, max_total_size, open_files)
         
-        logger.info(f"{count} fichiers de logs supprimés")
+        freed = 0
+        count = 0
+        for path, size in selected:
+            if dry_run:
+                count += 1
+                freed += size
+                continue
+            try:
+                os.remove(path)
+                count += 1
+                freed += size
+            except FileNotFoundError:
+                pass
+                
+        criteria = f"plus de {days} jours" if days is not None else "sans limite d'âge"
+        if max_total_size is not None:
+            criteria += f", plafond {max_total_size / 1048576:.1f} Mo"
+        if dry_run:
+            logger.info(f"Purge des logs ({criteria}, simulation): {count} fichiers seraient supprimés "
+                        f"({freed / 1048576:.1f} Mo): {_render_value([p for p, _ in selected])}")
+        else:
+            logger.info(f"Purge des logs ({criteria}): {count} fichiers supprimés ({freed / 1048576:.1f} Mo libérés)")
         return count
     except Exception as e:
         logger.error(f"Erreur lors de la purge des logs: {str(e)}")
         logger.error(traceback.format_exc())
         return 0
 
+def start_log_purge_scheduler(interval=86400, days=30, base_dir=None, max_total_size=None):
+    """Démarre une purge périodique des logs dans un thread d'arrière-plan
+
+    Une première purge est lancée immédiatement, puis toutes les `interval` secondes.
+
+    Args:
+        interval (float): Intervalle entre deux purges, en secondes
+        days (int, optional): Âge maximal en jours (voir purge_old_logs)
+        base_dir (str, optional): Répertoire de base des logs
+        max_total_size (int, optional): Taille totale maximale du dossier en octets
+    """
+    global _purge_thread, _purge_stop
+    stop_log_purge_scheduler()
+    stop = threading.Event()
+
+    def _run():
+        while True:
+            purge_old_logs(days, base_dir, max_total_size)
+            if stop.wait(interval):
+                break
+
+    thread = threading.Thread(target=_run, name="EndoriumUtils-log-purge", daemon=True)
+    _purge_stop = stop
+    _purge_thread = thread
+    thread.start()
+
+def stop_log_purge_scheduler():
+    """Arrête la purge périodique des logs (attend la fin d'une purge en cours)"""
+    global _purge_thread, _purge_stop
+    if _purge_thread is not None:
+        _purge_stop.set()
+        _purge_thread.join()
+        _purge_thread = None
+        _purge_stop = None
+
 def set_log_level(logger, level):
-    """Change dynamiquement le niveau de log d'un logger et de ses handlers."""
+    """Change dynamiquement le niveau de log d'un logger et de ses handlers.
+
+    Les handlers partagés du registre ne sont pas modifiés (ils servent aussi
+    aux autres loggers): leur filtrage suit le niveau de chaque logger.
+    """
     logger.setLevel(level)
     for handler in logger.handlers:
-        handler.setLevel(level)
+        if handler not in _shared_handler_set:
+            handler.setLevel(level)
 
 def get_log_file_paths(logger):
-    """Retourne la liste des chemins de fichiers utilisés par les handlers de type fichier du logger."""
+    """Retourne la liste des chemins de fichiers utilisés par les handlers de type fichier du logger.
+
+    Les handlers de fichiers partagés sont retrouvés via le registre: en mode
+    asynchrone, le logger ne porte qu'un QueueHandler.
+    """
+    with _registry_lock:
+        handlers = list(_shared_handlers.get(getattr(logger, "_endorium_handlers_key", None), ()))
+    handlers += [handler for handler in logger.handlers if handler not in handlers]
     paths = []
-    for handler in logger.handlers:
+    for handler in handlers:
         if hasattr(handler, 'baseFilename'):
             paths.append(handler.baseFilename)
     return paths
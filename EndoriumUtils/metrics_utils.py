@@ -0,0 +1,266 @@
+"""
+Module d'agrégation des métriques de performance pour EndoriumUtils
+
+Alimenté par log_performance et log_function_call: compteurs et histogrammes
+de latence (p50/p95/p99/max) par section ou par fonction, mesurés avec
+time.perf_counter_ns.
+"""
+
+import os
+import csv
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any
+
+# Histogramme log-linéaire: 16 sous-intervalles par puissance de 2, soit une
+# erreur relative inférieure à ~6% quelle que soit la latence mesurée.
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+SNAPSHOT_FIELDS = ("name", "count", "errors", "total_ms", "mean_ms", "min_ms",
+                   "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+def _bucket_index(value: int) -> int:
+    """Renvoie l'indice du bucket d'une durée en nanosecondes"""
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+def _bucket_midpoint(index: int) -> float:
+    """Renvoie la valeur centrale (en nanosecondes) d'un bucket"""
+    if index < _SUB_BUCKETS:
+        return float(index)
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    mantissa = (index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS
+    lower = mantissa << shift
+    return lower + ((1 << shift) - 1) / 2
+
+class LatencyHistogram:
+    """Histogramme de latences en flux, de taille bornée"""
+    __slots__ = ("count", "errors", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.buckets = {}
+
+    def record(self, duration_ns: int, error: bool = False) -> None:
+        """Ajoute une mesure (en nanosecondes)"""
+        duration_ns = max(int(duration_ns), 0)
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        index = _bucket_index(duration_ns)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentiles(self, *quantiles: float) -> list:
+        """Renvoie les percentiles demandés (en nanosecondes, bornés par min/max)"""
+        if not self.count:
+            return [0.0 for _ in quantiles]
+        targets = sorted((max(1, math.ceil(q * self.count)), i)
+                         for i, q in enumerate(quantiles))
+        results = [0.0] * len(quantiles)
+        cumulative = 0
+        position = 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            while position < len(targets) and targets[position][0] <= cumulative:
+                value = _bucket_midpoint(index)
+                results[targets[position][1]] = float(min(max(value, self.min_ns), self.max_ns))
+                position += 1
+            if position == len(targets):
+                break
+        return results
+
+    def summary(self) -> Dict[str, Any]:
+        """Renvoie un résumé compact (durées en millisecondes)"""
+        p50, p95, p99 = self.percentiles(0.50, 0.95, 0.99)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ns / 1e6, 6),
+            "mean_ms": round(self.total_ns / self.count / 1e6, 6) if self.count else 0.0,
+            "min_ms": round((self.min_ns or 0) / 1e6, 6),
+            "p50_ms": round(p50 / 1e6, 6),
+            "p95_ms": round(p95 / 1e6, 6),
+            "p99_ms": round(p99 / 1e6, 6),
+            "max_ms": round(self.max_ns / 1e6, 6),
+        }
+
+class MetricsRegistry:
+    """Registre en mémoire des métriques de performance par section/fonction"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._flush_thread = None
+        self._flush_stop = None
+
+    def record(self, name: str, duration_ns: int, error: bool = False) -> None:
+        """
+        Enregistre une durée pour une section ou une fonction
+
+        Args:
+            name (str): Nom de la section ou de la fonction
+            duration_ns (int): Durée mesurée en nanosecondes
+            error (bool): True si l'exécution s'est terminée par une exception
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(duration_ns, error)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Context manager mesurant une section de code avec perf_counter_ns"""
+        start = time.perf_counter_ns()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record(name, time.perf_counter_ns() - start, error)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Renvoie un instantané des métriques
+
+        Args:
+            reset (bool): Si True, remet les compteurs à zéro de façon atomique
+
+        Returns:
+            dict: Résumé par nom (count, errors, total/mean/min/p50/p95/p99/max en ms)
+        """
+        with self._lock:
+            if reset:
+                histograms = self._histograms
+                self._histograms = {}
+            else:
+                # Copie sous le verrou: les histogrammes restent alimentés
+                histograms = {name: _copy_histogram(h) for name, h in self._histograms.items()}
+        return {name: h.summary() for name, h in sorted(histograms.items())}
+
+    def reset(self) -> None:
+        """Remet toutes les métriques à zéro"""
+        with self._lock:
+            self._histograms = {}
+
+    def flush(self, path: str, file_format: str = "jsonl", reset: bool = False) -> bool:
+        """
+        Ajoute un résumé des métriques à un fichier JSON-lines ou CSV
+
+        Args:
+            path (str): Fichier de destination (créé si nécessaire)
+            file_format (str): 'jsonl' (une ligne JSON par nom) ou 'csv'
+            reset (bool): Si True, remet les compteurs à zéro après l'instantané
+
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        if file_format not in ("jsonl", "csv"):
+            raise ValueError(f"Format de métriques non supporté: {file_format}")
+        summary = self.snapshot(reset=reset)
+        if not summary:
+            return True
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        try:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            if file_format == "jsonl":
+                lines = [json.dumps(dict(ts=timestamp, name=name, **values), ensure_ascii=False)
+                         for name, values in summary.items()]
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            else:
+                write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+                with open(path, "a", encoding="utf-8", newline="") as f:
+                    writer = csv.writer(f)
+                    if write_header:
+                        writer.writerow(("ts",) + SNAPSHOT_FIELDS)
+                    for name, values in summary.items():
+                        writer.writerow([timestamp, name] + [values[k] for k in SNAPSHOT_FIELDS[1:]])
+            return True
+        except Exception as e:
+            from EndoriumUtils.log_utils import get_logger
+            get_logger("EndoriumUtils.metrics_utils").error(
+                f"Erreur lors de l'écriture des métriques dans {path}: {str(e)}")
+            return False
+
+    def start_periodic_flush(self, path: str, interval: float = 60.0,
+                             file_format: str = "jsonl", reset: bool = True) -> None:
+        """
+        Démarre un thread qui écrit périodiquement le résumé des métriques
+
+        Args:
+            path (str): Fichier de destination
+            interval (float): Intervalle entre deux écritures, en secondes
+            file_format (str): 'jsonl' ou 'csv'
+            reset (bool): Si True, chaque écriture couvre uniquement l'intervalle écoulé
+        """
+        self.stop_periodic_flush()
+        stop = threading.Event()
+
+        def _run():
+            while not stop.wait(interval):
+                self.flush(path, file_format, reset)
+            # Dernière écriture à l'arrêt pour ne rien perdre
+            self.flush(path, file_format, reset)
+
+        thread = threading.Thread(target=_run, name="EndoriumUtils-metrics", daemon=True)
+        self._flush_stop = stop
+        self._flush_thread = thread
+        thread.start()
+
+    def stop_periodic_flush(self) -> None:
+        """Arrête l'écriture périodique (après une dernière écriture)"""
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+            self._flush_stop = None
+
+def _copy_histogram(histogram: LatencyHistogram) -> LatencyHistogram:
+    """Copie un histogramme (appelé sous le verrou du registre)"""
+    copy = LatencyHistogram()
+    copy.count = histogram.count
+    copy.errors = histogram.errors
+    copy.total_ns = histogram.total_ns
+    copy.min_ns = histogram.min_ns
+    copy.max_ns = histogram.max_ns
+    copy.buckets = dict(histogram.buckets)
+    return copy
+
+# Registre par défaut du processus, alimenté par log_performance et log_function_call
+_default_registry = MetricsRegistry()
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Renvoie le registre de métriques par défaut du processus"""
+    return _default_registry
+
+def record_timing(name: str, duration_ns: int, error: bool = False) -> None:
+    """Enregistre une durée (en nanosecondes) dans le registre par défaut"""
+    _default_registry.record(name, duration_ns, error)
+
+def get_metrics_snapshot(reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Renvoie un instantané du registre par défaut (voir MetricsRegistry.snapshot)"""
+    return _default_registry.snapshot(reset=reset)
+
+def reset_metrics() -> None:
+    """Remet à zéro le registre par défaut"""
+    _default_registry.reset()
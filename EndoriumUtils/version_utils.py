@@ -5,9 +5,11 @@ Module de gestion des versions pour EndoriumUtils
 import os
 import re
 import sys
-from EndoriumUtils.log_utils import get_logger, log_function_call
+from contextlib import nullcontext
+from EndoriumUtils.log_utils import get_lazy_logger, log_function_call
+from EndoriumUtils.file_utils import safe_write_file, file_lock
 
-logger = get_logger("EndoriumUtils.version_utils")
+logger = get_lazy_logger("EndoriumUtils.version_utils")
 
 @log_function_call
 def get_version_file_path(project_dir=None):
@@ -66,71 +68,88 @@ def get_version(project_dir=None):
     return version_str, version
 
 @log_function_call
-def write_version(version, project_dir=None):
+def write_version(version, project_dir=None, lock=False, lock_timeout=None):
     """
     Écrit la nouvelle version dans le fichier
     
+    Les fichiers sont remplacés atomiquement: un lecteur concurrent ne voit
+    jamais un fichier vide ou partiel.
+    
     Args:
         version (list): Liste des composants de version [major, minor, patch]
         project_dir (str, optional): Répertoire du projet. Si None, utilise le répertoire courant.
+        lock (bool): Si True, écrit sous file_lock(version.txt) pour sérialiser les écrivains
+        lock_timeout (float, optional): Attente maximale du verrou en secondes (None: illimitée)
         
     Returns:
         str: Chaîne de version écrite
+        
+    Raises:
+        OSError: Si un fichier n'a pas pu être écrit
+        TimeoutError: Si le verrou n'a pas été obtenu à temps
     """
     version_file = get_version_file_path(project_dir)
     version_str = ".".join(map(str, version))
     
-    with open(version_file, 'w') as f:
-        f.write(version_str)
-    
-    # Mettre à jour aussi version.py si existant
-    version_py = os.path.join(os.path.dirname(version_file), "version.py")
-    if os.path.exists(version_py):
-        with open(version_py, 'w') as f:
-            f.write(f'VERSION = "{version_str}"\n')
+    with file_lock(version_file, timeout=lock_timeout) if lock else nullcontext():
+        if not safe_write_file(version_file, version_str):
+            raise OSError(f"Impossible d'écrire le fichier de version {version_file}")
+        
+        # Mettre à jour aussi version.py si existant
+        version_py = os.path.join(os.path.dirname(version_file), "version.py")
+        if os.path.exists(version_py):
+            if not safe_write_file(version_py, f'VERSION = "{version_str}"\n'):
+                raise OSError(f"Impossible d'écrire le fichier {version_py}")
             
     logger.info(f"Version mise à jour : {version_str}")
     return version_str
 
 @log_function_call
-def increment_version(level='patch', project_dir=None):
+def increment_version(level='patch', project_dir=None, lock=False, lock_timeout=None):
     """
     Incrémente la version selon le niveau spécifié
     
     Args:
         level (str): Niveau d'incrémentation ('major', 'minor', 'patch')
         project_dir (str, optional): Répertoire du projet. Si None, utilise le répertoire courant.
+        lock (bool): Si True, la lecture et l'écriture se font sous un même file_lock:
+                     aucune incrémentation concurrente (autre processus) n'est perdue
+        lock_timeout (float, optional): Attente maximale du verrou en secondes (None: illimitée)
         
     Returns:
         str: Nouvelle version après incrémentation
     """
-    _, current_version = get_version(project_dir)
-    major, minor, patch = current_version
-    
-    if level == 'patch':
-        patch += 1
-    elif level == 'minor':
-        minor += 1
-        patch = 0
-    elif level == 'major':
-        major += 1
-        minor = 0
-        patch = 0
-    else:
-        logger.warning(f"Niveau d'incrémentation inconnu: {level}. Utilisation de 'patch'")
-        patch += 1
-    
-    new_version = [major, minor, patch]
-    return write_version(new_version, project_dir)
+    version_file = get_version_file_path(project_dir)
+    with file_lock(version_file, timeout=lock_timeout) if lock else nullcontext():
+        _, current_version = get_version(project_dir)
+        major, minor, patch = current_version
+        
+        if level == 'patch':
+            patch += 1
+        elif level == 'minor':
+            minor += 1
+            patch = 0
+        elif level == 'major':
+            major += 1
+            minor = 0
+            patch = 0
+        else:
+            logger.warning(f"Niveau d'incrémentation inconnu: {level}. Utilisation de 'patch'")
+            patch += 1
+        
+        new_version = [major, minor, patch]
+        return write_version(new_version, project_dir)
 
 @log_function_call
-def set_version(version_str, project_dir=None):
+def set_version(version_str, project_dir=None, lock=False, lock_timeout=None):
     """
     Définit explicitement une version
     
     Args:
         version_str (str): Chaîne de version (ex: "1.0.0")
         project_dir (str, optional): Répertoire du projet. Si None, utilise le répertoire courant.
+        lock (bool): Si True, écrit sous file_lock (voir write_version)
+        lock_timeout (float, optional): Attente maximale du verrou en secondes (None: illimitée)
         
     Returns:
         str: Version définie ou None en cas d'erreur
@@ -143,4 +162,4 @@ def set_version(version_str, project_dir=None):
         return None
         
     version = [int(match.group(1)), int(match.group(2)), int(match.group(3))]
-    return write_version(version, project_dir)
+    return write_version(version, project_dir, lock, lock_timeout)
@@ -55,7 +55,7 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     keywords="logging, version management, utilities, configuration",
     project_urls={
         "Bug Reports": "https://github.com/NergYR/EndoriumUtils/issues",
@@ -71,5 +71,7 @@ setup(
     extras_require={
         "yaml": ["pyyaml"],  # Dépendances optionnelles pour le support YAML
         "ldap": ["ldap3"],   # Dépendances optionnelles pour LDAP
+        "fast": ["orjson"],  # Backend JSON rapide optionnel
+        "zstd": ["zstandard"],  # Compression zstd optionnelle des logs
     },
 )